@@ -142,7 +142,7 @@ class FlashReport:
         cfg = bigquery.QueryJobConfig(query_parameters=[
             bigquery.ScalarQueryParameter("d", "STRING", d),
         ])
-        row = list(self.bq.query(sql, job_config=cfg).result())[0]
+        row = next(iter(self.bq.query(sql, job_config=cfg).result(max_results=1)))
         return {
             "revenue": round(float(row.revenue), 2),
             "orders": int(row.orders),
@@ -153,34 +153,29 @@ class FlashReport:
         }
 
     def _query_top_servers(self, d: str) -> List[Dict]:
-        """Top 5 servers by revenue for a single date."""
+        """Top 5 servers by revenue for a single date.
+
+        Rounding and null-handling happen in SQL so the result set can be
+        decoded straight from Arrow into JSON-ready dicts.
+        """
         sql = f"""
         SELECT
-            COALESCE(server, 'Unknown') AS server_name,
-            COUNT(DISTINCT order_id) AS order_count,
-            COALESCE(SUM(total), 0) AS total_revenue,
-            COALESCE(SUM(tip), 0) AS tips,
-            COALESCE(SUM(gratuity), 0) AS gratuity
+            COALESCE(server, 'Unknown') AS server,
+            ROUND(COALESCE(SUM(total), 0), 2) AS revenue,
+            COUNT(DISTINCT order_id) AS orders,
+            ROUND(COALESCE(SUM(tip), 0), 2) AS tips
         FROM {self.table_prefix}.OrderDetails_raw`
         WHERE processing_date = PARSE_DATE('%Y-%m-%d', @d)
           AND (voided IS NULL OR voided = 'false')
         GROUP BY server
-        ORDER BY total_revenue DESC
+        ORDER BY revenue DESC
         LIMIT 5
         """
         cfg = bigquery.QueryJobConfig(query_parameters=[
             bigquery.ScalarQueryParameter("d", "STRING", d),
         ])
-        rows = list(self.bq.query(sql, job_config=cfg).result())
-        return [
-            {
-                "server": r.server_name,
-                "revenue": round(float(r.total_revenue), 2),
-                "orders": int(r.order_count),
-                "tips": round(float(r.tips), 2),
-            }
-            for r in rows
-        ]
+        result = self.bq.query(sql, job_config=cfg).result()
+        return result.to_arrow(create_bqstorage_client=False).to_pylist()
 
     def _query_expenses(self, d: str) -> Dict:
         """Expense totals by major category section for a single date."""
@@ -220,31 +215,27 @@ class FlashReport:
         """Cash collected (POS) vs deposited (bank) for a single date."""
         bd = BUSINESS_DAY_SQL.format(dt_col="CAST(paid_date AS DATETIME)")
 
-        # POS cash collected
-        pos_sql = f"""
-        SELECT COALESCE(SUM(total), 0) AS cash_collected
-        FROM {self.table_prefix}.PaymentDetails_raw`
-        WHERE {bd} = @d
-          AND LOWER(COALESCE(payment_type, '')) = 'cash'
-          AND status = 'CAPTURED'
+        # POS cash collected and bank cash deposits (counter credits) in one job
+        sql = f"""
+        SELECT
+          (SELECT COALESCE(SUM(total), 0)
+           FROM {self.table_prefix}.PaymentDetails_raw`
+           WHERE {bd} = @d
+             AND LOWER(COALESCE(payment_type, '')) = 'cash'
+             AND status = 'CAPTURED') AS cash_collected,
+          (SELECT COALESCE(SUM(amount), 0)
+           FROM {self.table_prefix}.BankTransactions_raw`
+           WHERE transaction_date = PARSE_DATE('%Y-%m-%d', @d)
+             AND amount > 0
+             AND (LOWER(description) LIKE '%counter credit%'
+                  OR LOWER(description) LIKE '%cash deposit%')) AS cash_deposited
         """
         cfg = bigquery.QueryJobConfig(query_parameters=[
             bigquery.ScalarQueryParameter("d", "STRING", d),
         ])
-        pos_row = list(self.bq.query(pos_sql, job_config=cfg).result())[0]
-        collected = round(float(pos_row.cash_collected), 2)
-
-        # Bank cash deposits (counter credits)
-        bank_sql = f"""
-        SELECT COALESCE(SUM(amount), 0) AS cash_deposited
-        FROM {self.table_prefix}.BankTransactions_raw`
-        WHERE transaction_date = PARSE_DATE('%Y-%m-%d', @d)
-          AND amount > 0
-          AND (LOWER(description) LIKE '%counter credit%'
-               OR LOWER(description) LIKE '%cash deposit%')
-        """
-        bank_row = list(self.bq.query(bank_sql, job_config=cfg).result())[0]
-        deposited = round(float(bank_row.cash_deposited), 2)
+        row = next(iter(self.bq.query(sql, job_config=cfg).result(max_results=1)))
+        collected = round(float(row.cash_collected), 2)
+        deposited = round(float(row.cash_deposited), 2)
 
         return {
             "collected": collected,
@@ -368,7 +368,8 @@ class GratuityReportGenerator:
                 timeout=30,
             )
             if resp.status_code >= 400:
-                logger.error(f"Resend {resp.status_code} for {to_email}: {resp.text[:300]}")
+                body = resp.content[:300].decode(resp.encoding or "utf-8", "replace")
+                logger.error(f"Resend {resp.status_code} for {to_email}: {body}")
                 return False
             data = resp.json() if resp.content else {}
             logger.info(f"Gratuity report email → {to_email} ok (id={data.get('id')})")
@@ -56,11 +56,13 @@ class ToastLaborETL:
         self.employees: Dict[str, str] = {}
         self.jobs: Dict[str, str] = {}
         self.bq = bigquery.Client(project=PROJECT_ID)
+        # Reused across the auth call and every page of every day in a run
+        self.http = requests.Session()
 
     def authenticate(self):
         if self._token and time.time() < self._token_expires - 60:
             return
-        resp = requests.post(
+        resp = self.http.post(
             f"{TOAST_API_BASE}/authentication/v1/authentication/login",
             headers={"Content-Type": "application/json"},
             json={
@@ -83,7 +85,7 @@ class ToastLaborETL:
         }
 
     def _get(self, path: str, params: dict = None) -> Any:
-        resp = requests.get(f"{TOAST_API_BASE}{path}", headers=self.headers, params=params)
+        resp = self.http.get(f"{TOAST_API_BASE}{path}", headers=self.headers, params=params)
         if resp.status_code == 429:
             wait = int(resp.headers.get("Retry-After", 5))
             log.warning("Rate limited — waiting %ds", wait)
@@ -178,7 +180,7 @@ class ToastLaborETL:
         config = bigquery.QueryJobConfig(query_parameters=[
             bigquery.ScalarQueryParameter("processing_date", "DATE", processing_date),
         ])
-        existing = list(self.bq.query(check_q, job_config=config).result())[0].cnt
+        existing = next(iter(self.bq.query(check_q, job_config=config).result(max_results=1))).cnt
 
         if existing > 0:
             log.info("  %s: %d entries already exist — skipping (use --force to reload)",
@@ -209,18 +211,15 @@ class ToastLaborETL:
         start = datetime.strptime(start_date, "%Y%m%d").date()
         end = datetime.strptime(end_date, "%Y%m%d").date()
 
+        # Resolve the open-day schedule once up front rather than per iteration
+        all_days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        open_dates = [d.strftime("%Y%m%d") for d in all_days if d.weekday() not in CLOSED_DAYS]
+
         total_rows = 0
         dates_processed = 0
-        dates_skipped = 0
-        d = start
-
-        while d <= end:
-            if d.weekday() in CLOSED_DAYS:
-                d += timedelta(days=1)
-                dates_skipped += 1
-                continue
+        dates_skipped = len(all_days) - len(open_dates)
 
-            dt_str = d.strftime("%Y%m%d")
+        for dt_str in open_dates:
             try:
                 rows = self.pull_and_load(dt_str, dry_run)
                 total_rows += rows
@@ -229,7 +228,6 @@ class ToastLaborETL:
                 log.error("  %s: failed — %s", dt_str, e)
 
             time.sleep(0.1)
-            d += timedelta(days=1)
 
         log.info("Done: %d dates processed, %d rows loaded, %d skipped (closed)",
                  dates_processed, total_rows, dates_skipped)
@@ -7,6 +7,7 @@ import time
 import uuid
 
 from flask import Flask, request, g, jsonify
+from flask_compress import Compress
 
 from routes_etl import bp as etl_bp
 from routes_bank import bp as bank_bp
@@ -77,6 +78,13 @@ _setup_logging()
 
 # ─── Flask app ──────────────────────────────────────────────────────────────
 app = Flask(__name__)
+# Dashboards are 50-300 KB of inline HTML/JS and the analytics APIs return
+# repetitive JSON rows — negotiate br/gzip via Accept-Encoding.
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_LEVEL"] = 4
+app.config["COMPRESS_BR_LEVEL"] = 4
+app.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app)
 app.register_blueprint(etl_bp)
 app.register_blueprint(bank_bp)
 app.register_blueprint(dashboards_bp)
@@ -13,10 +13,13 @@ class PipelineResult:
     rows_updated: int = 0
     error_message: str = ""
     schema_changes: List[str] = None
+    dropped_columns: List[str] = None  # columns the target table doesn't have
 
     def __post_init__(self):
         if self.schema_changes is None:
             self.schema_changes = []
+        if self.dropped_columns is None:
+            self.dropped_columns = []
 
 
 @dataclass
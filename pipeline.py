@@ -8,8 +8,9 @@ transforms them, and loads into BigQuery.
 import io
 import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 from google.cloud import bigquery
@@ -20,10 +21,19 @@ from services import SecretManager, ToastSFTPClient, SchemaValidator, DataTransf
 
 logger = logging.getLogger(__name__)
 
+# Per-date SFTP listing fingerprint of the last fully successful load
+FINGERPRINT_TABLE = f"{PROJECT_ID}.{DATASET_ID}.EtlDateFingerprints"
+
 
 class ToastPipeline:
     """Main pipeline orchestrator"""
 
+    # Concurrent transform/load workers per run (I/O-bound on BigQuery)
+    LOAD_WORKERS = 4
+
+    # Parser for Toast exports; set to "c" to always use pandas' own parser
+    CSV_ENGINE = "pyarrow"
+
     def __init__(self):
         self.bq_client = bigquery.Client(project=PROJECT_ID)
         self.secret_manager = SecretManager(PROJECT_ID)
@@ -31,6 +41,7 @@ class ToastPipeline:
         self.transformer = DataTransformer()
         self.loader = BigQueryLoader(self.bq_client, DATASET_ID)
         self.alert_manager = AlertManager(ALERT_WEBHOOK_URL, ALERT_EMAIL)
+        self._fingerprint_table_ready = False
 
     def generate_run_id(self) -> str:
         """Generate unique run ID"""
@@ -38,31 +49,101 @@ class ToastPipeline:
         hash_suffix = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:6]
         return f"run_{timestamp}_{hash_suffix}"
 
-    def process_file(
+    @staticmethod
+    def get_date_range(processing_date: str, backfill_days: int = 0) -> List[str]:
+        """Dates to process (YYYYMMDD), newest first, ending backfill_days before processing_date"""
+        if backfill_days <= 0:
+            return [processing_date]
+        end = datetime.strptime(processing_date, "%Y%m%d")
+        dates = pd.date_range(end=end, periods=backfill_days + 1, freq="D")
+        return dates[::-1].strftime("%Y%m%d").tolist()
+
+    def fetch_file(
         self,
         sftp_client: ToastSFTPClient,
         date_str: str,
         filename: str
-    ) -> PipelineResult:
-        """Process a single file"""
+    ) -> Tuple[PipelineResult, Optional[bytes]]:
+        """Download a single file. Returns (result, bytes); bytes is None if the result is final."""
         result = PipelineResult(filename=filename, status="pending")
 
+        # Check if we have config for this file
+        if filename not in FILE_CONFIGS:
+            result.status = "skipped"
+            result.error_message = "No configuration for file"
+            return result, None
+
         try:
-            # Check if we have config for this file
-            if filename not in FILE_CONFIGS:
-                result.status = "skipped"
-                result.error_message = "No configuration for file"
-                return result
+            logger.info(f"Downloading {filename}...")
+            return result, sftp_client.download_file(date_str, filename)
+        except Exception as e:
+            result.status = "error"
+            result.error_message = str(e)
+            logger.error(f"Error processing {filename}: {e}")
+            return result, None
+
+    def load_file(
+        self,
+        result: PipelineResult,
+        date_str: str,
+        file_bytes: bytes
+    ) -> PipelineResult:
+        """Parse, transform and load one downloaded file into BigQuery"""
+        try:
+            df = self.read_csv(file_bytes)
+        except Exception as e:
+            result.status = "error"
+            result.error_message = str(e)
+            logger.error(f"Error processing {result.filename}: {e}")
+            return result
+        return self.load_dataframe(result, date_str, df)
+
+    def read_csv(self, file_bytes: bytes) -> pd.DataFrame:
+        """Parse a Toast export, with pyarrow's multithreaded reader where it is safe"""
+        if self.CSV_ENGINE == "pyarrow":
+            try:
+                df = pd.read_csv(io.BytesIO(file_bytes), engine="pyarrow")
+            except Exception as e:
+                # e.g. quoted newlines, which the pyarrow reader rejects by default
+                logger.debug(f"pyarrow CSV parse failed, using default parser: {e}")
+            else:
+                # Duplicate headers keep their names under pyarrow; the default
+                # parser dedupes them as "a", "a.1"
+                if df.columns.is_unique and not self._has_inferred_temporal(df):
+                    return df
+        return pd.read_csv(io.BytesIO(file_bytes))
+
+    @staticmethod
+    def _has_inferred_temporal(df: pd.DataFrame) -> bool:
+        """True if pyarrow typed a column as date/time/timestamp.
+
+        The default parser keeps those as the original text, which is what
+        gets loaded, so such files are re-read with it.
+        """
+        for i in range(df.shape[1]):
+            values = df.iloc[:, i]
+            if pd.api.types.is_datetime64_any_dtype(values.dtype):
+                return True
+            if values.dtype == object:
+                first = values.first_valid_index()
+                # Arrow columns are uniformly typed, so the first value decides
+                if first is not None and isinstance(values[first], (date, time)):
+                    return True
+        return False
+
+    def load_dataframe(
+        self,
+        result: PipelineResult,
+        date_str: str,
+        df: pd.DataFrame
+    ) -> PipelineResult:
+        """Transform and load an already-parsed file into BigQuery"""
+        filename = result.filename
 
+        try:
             config = FILE_CONFIGS[filename]
             table_loc = config["table"]
 
-            # Download file
-            logger.info(f"Downloading {filename}...")
-            file_bytes = sftp_client.download_file(date_str, filename)
-
-            # Parse CSV
-            df = pd.read_csv(io.BytesIO(file_bytes))
             result.rows_processed = len(df)
 
             if df.empty:
@@ -83,12 +164,24 @@ class ToastPipeline:
             processing_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
             df = self.transformer.transform_dataframe(df, config, processing_date)
 
-            # Load to BigQuery
-            if not self.loader.table_exists(table_loc):
+            # Load to BigQuery. A schema from the check above already proves the
+            # table exists, so only ask BigQuery again when it came back empty.
+            table_schema = self.schema_validator.get_table_schema(table_loc)
+            table_found = bool(table_schema) or self.loader.table_exists(table_loc)
+            if not table_found:
                 # Create new table
                 self.loader.create_table_from_df(df, table_loc)
                 result.rows_inserted = len(df)
             else:
+                # Columns the table doesn't have would be rejected by the load
+                # anyway; drop them before they are serialized and uploaded, and
+                # report them so the run summary alert flags the lost data
+                if table_schema:
+                    extra = [col for col in df.columns if col not in table_schema]
+                    if extra:
+                        logger.warning(f"Dropping columns not in {table_loc} from {filename}: {extra}")
+                        result.dropped_columns = extra
+                        df = df.drop(columns=extra)
                 # Delete existing data for this date and append
                 self.loader.delete_date_partition(table_loc, processing_date)
                 rows = self.loader.append_data(df, table_loc)
@@ -104,13 +197,86 @@ class ToastPipeline:
 
         return result
 
-    def run(self, processing_date: str = None, backfill_days: int = 0) -> PipelineRunSummary:
+    def process_file(
+        self,
+        sftp_client: ToastSFTPClient,
+        date_str: str,
+        filename: str
+    ) -> PipelineResult:
+        """Process a single file"""
+        result, file_bytes = self.fetch_file(sftp_client, date_str, filename)
+        if file_bytes is None:
+            return result
+        return self.load_file(result, date_str, file_bytes)
+
+    # ── Fingerprint state (BQ-backed) ───────────────────────────────────
+
+    def _ensure_fingerprint_table(self) -> None:
+        if self._fingerprint_table_ready:
+            return
+        try:
+            self.bq_client.get_table(FINGERPRINT_TABLE)
+            self._fingerprint_table_ready = True
+            return
+        except Exception:
+            pass
+        schema = [
+            bigquery.SchemaField("processing_date", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("fingerprint", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("run_id", "STRING", mode="NULLABLE"),
+            bigquery.SchemaField("loaded_at", "TIMESTAMP", mode="NULLABLE"),
+        ]
+        self.bq_client.create_table(bigquery.Table(FINGERPRINT_TABLE, schema=schema))
+        self._fingerprint_table_ready = True
+        logger.info(f"Created BQ table {FINGERPRINT_TABLE}")
+
+    def _load_fingerprints(self, dates: List[str]) -> Dict[str, str]:
+        """Last stored fingerprint per date (YYYYMMDD), for the dates requested."""
+        self._ensure_fingerprint_table()
+        sql = f"""
+        SELECT processing_date, fingerprint FROM `{FINGERPRINT_TABLE}`
+        WHERE processing_date IN UNNEST(@dates)
+        """
+        params = [bigquery.ArrayQueryParameter("dates", "STRING", dates)]
+        job = self.bq_client.query(sql, job_config=bigquery.QueryJobConfig(query_parameters=params))
+        return {r.processing_date: r.fingerprint for r in job.result()}
+
+    def _save_fingerprint(self, date_str: str, fingerprint: str, run_id: str) -> None:
+        """Upsert the fingerprint for a date after all its files loaded cleanly."""
+        # Forced runs never read fingerprints, so the table may not exist yet
+        self._ensure_fingerprint_table()
+        sql = f"""
+        MERGE `{FINGERPRINT_TABLE}` T
+        USING (SELECT
+            @processing_date AS processing_date,
+            @fingerprint AS fingerprint,
+            @run_id AS run_id,
+            CURRENT_TIMESTAMP() AS loaded_at
+        ) S
+        ON T.processing_date = S.processing_date
+        WHEN MATCHED THEN UPDATE SET
+            fingerprint = S.fingerprint,
+            run_id = S.run_id,
+            loaded_at = S.loaded_at
+        WHEN NOT MATCHED THEN INSERT (processing_date, fingerprint, run_id, loaded_at)
+            VALUES (S.processing_date, S.fingerprint, S.run_id, S.loaded_at)
+        """
+        params = [
+            bigquery.ScalarQueryParameter("processing_date", "STRING", date_str),
+            bigquery.ScalarQueryParameter("fingerprint", "STRING", fingerprint),
+            bigquery.ScalarQueryParameter("run_id", "STRING", run_id),
+        ]
+        self.bq_client.query(sql, job_config=bigquery.QueryJobConfig(query_parameters=params)).result()
+
+    def run(self, processing_date: str = None, backfill_days: int = 0,
+            force: bool = False) -> PipelineRunSummary:
         """
         Run the pipeline
 
         Args:
             processing_date: Date to process (YYYYMMDD), defaults to yesterday
             backfill_days: Number of days to backfill (0 = just processing_date)
+            force: Reload dates even if their SFTP files are unchanged since the last load
         """
         # Default to yesterday
         if not processing_date:
@@ -128,14 +294,33 @@ class ToastPipeline:
             sftp_key = self.secret_manager.get_sftp_key()
 
             # Process dates
-            dates_to_process = [processing_date]
-            if backfill_days > 0:
-                base_date = datetime.strptime(processing_date, "%Y%m%d")
-                for i in range(1, backfill_days + 1):
-                    prev_date = base_date - timedelta(days=i)
-                    dates_to_process.append(prev_date.strftime("%Y%m%d"))
-
-            with ToastSFTPClient(SFTP_HOST, SFTP_PORT, SFTP_USER, sftp_key) as sftp:
+            dates_to_process = self.get_date_range(processing_date, backfill_days)
+
+            stored_fingerprints: Dict[str, str] = {}
+            if not force:
+                try:
+                    stored_fingerprints = self._load_fingerprints(dates_to_process)
+                except Exception as e:
+                    logger.warning(f"Could not read load fingerprints, reprocessing all dates: {e}")
+            new_fingerprints: Dict[str, str] = {}
+
+            # Downloads stay serial on the one SFTP channel; transform + BigQuery
+            # load for each file runs on a small thread pool so load latency
+            # overlaps with the next download. Each date's loads finish before
+            # the next date starts: every file maps to its own table, so loads
+            # into one table never overlap, and only one date's downloads are
+            # held in memory at a time.
+            failed_dates = set()
+            with ThreadPoolExecutor(max_workers=self.LOAD_WORKERS) as pool, \
+                    ToastSFTPClient(SFTP_HOST, SFTP_PORT, SFTP_USER, sftp_key) as sftp:
+                # A backfill lists the date directories once so missing dates
+                # cost no round trip; a single-date run just lists its own
+                if len(dates_to_process) > 1:
+                    try:
+                        sftp.available_dates()
+                    except Exception as e:
+                        logger.warning(f"Could not list SFTP date directories: {e}")
+
                 for date_str in dates_to_process:
                     logger.info(f"Processing date: {date_str}")
 
@@ -146,17 +331,58 @@ class ToastPipeline:
                         summary.errors.append(f"No files found for {date_str}")
                         continue
 
+                    # Skip dates whose export is unchanged since the last clean load
+                    try:
+                        fingerprint = sftp.date_fingerprint(date_str)
+                    except Exception as e:
+                        logger.warning(f"Could not fingerprint {date_str}: {e}")
+                        fingerprint = None
+                    if fingerprint and stored_fingerprints.get(date_str) == fingerprint:
+                        logger.info(f"Skipping {date_str}: files unchanged since last load")
+                        for filename in files:
+                            summary.results.append(PipelineResult(
+                                filename=filename, status="skipped",
+                                error_message="Unchanged since last load",
+                            ))
+                        continue
+                    if fingerprint:
+                        new_fingerprints[date_str] = fingerprint
+
                     # Process each file
+                    pending: List[Future] = []
                     for filename in files:
-                        result = self.process_file(sftp, date_str, filename)
+                        result, file_bytes = self.fetch_file(sftp, date_str, filename)
+                        if file_bytes is None:
+                            done = Future()
+                            done.set_result(result)
+                            pending.append(done)
+                        else:
+                            pending.append(pool.submit(self.load_file, result, date_str, file_bytes))
+
+                    for future in pending:
+                        result = future.result()
                         summary.results.append(result)
 
                         if result.status == "success":
                             summary.files_processed += 1
                             summary.total_rows += result.rows_inserted
+                            if result.dropped_columns:
+                                summary.errors.append(
+                                    f"{result.filename}: dropped columns not in table: "
+                                    f"{', '.join(result.dropped_columns)}"
+                                )
                         elif result.status == "error":
                             summary.files_failed += 1
-                            summary.errors.append(f"{filename}: {result.error_message}")
+                            summary.errors.append(f"{result.filename}: {result.error_message}")
+                            failed_dates.add(date_str)
+
+            for date_str, fingerprint in new_fingerprints.items():
+                if date_str in failed_dates:
+                    continue
+                try:
+                    self._save_fingerprint(date_str, fingerprint, summary.run_id)
+                except Exception as e:
+                    logger.warning(f"Could not save load fingerprint for {date_str}: {e}")
 
             summary.status = "success" if summary.files_failed == 0 else "partial_success"
 
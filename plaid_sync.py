@@ -143,6 +143,7 @@ class PlaidSync:
             "https://production.plaid.com" if environment == "production"
             else "https://sandbox.plaid.com"
         )
+        self._state_table_ready = False
 
     # ── Credentials ──────────────────────────────────────────────────
 
@@ -181,7 +182,8 @@ class PlaidSync:
         try:
             err = resp.json()
         except ValueError:
-            err = {"error_message": resp.text[:400]}
+            # Decode only the prefix we keep — resp.text decodes (and charset-sniffs) the whole body
+            err = {"error_message": resp.content[:400].decode(resp.encoding or "utf-8", "replace")}
         raise RuntimeError(
             f"Plaid {path} → HTTP {resp.status_code}: "
             f"{err.get('error_code','?')} — {err.get('error_message','')}"
@@ -190,8 +192,11 @@ class PlaidSync:
     # ── Cursor state (BQ-backed) ─────────────────────────────────────
 
     def _ensure_state_table(self) -> None:
+        if self._state_table_ready:
+            return
         try:
             self.bq.get_table(STATE_TABLE)
+            self._state_table_ready = True
             return
         except Exception:
             pass
@@ -202,6 +207,7 @@ class PlaidSync:
             bigquery.SchemaField("last_txn_date", "DATE", mode="NULLABLE"),
         ]
         self.bq.create_table(bigquery.Table(STATE_TABLE, schema=schema))
+        self._state_table_ready = True
         logger.info("Created BQ table %s", STATE_TABLE)
 
     def _load_cursor(self, item_id: str) -> str:
@@ -7,6 +7,7 @@ import json
 import logging
 import calendar
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from flask import Blueprint, request, jsonify, Response
@@ -27,7 +28,7 @@ from config import (
     DEFAULT_MIXED_BEV_TAX_PCT, DEFAULT_PROMOTER_PCT,
     PROMOTER_PAYOUT_TABLE,
 )
-from services import BofACSVParser, BankCategoryManager, CheckRegisterSync
+from services import BofACSVParser, BankCategoryManager, CheckRegisterSync, shared_bq_client
 from weekly_report import WeeklyReportGenerator
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,30 @@ logger = logging.getLogger(__name__)
 bp = Blueprint("analytics", __name__)
 
 
+# Row-level exports above this size download over the BigQuery Storage Read
+# API (Arrow streams) instead of paging JSON rows through the REST API.
+_BQSTORAGE_MIN_ROWS = 10_000
+
+
+@lru_cache(maxsize=1)
+def _bqstorage_client():
+    """Shared Storage Read client, or None if google-cloud-bigquery-storage isn't installed."""
+    try:
+        from google.cloud import bigquery_storage
+    except ImportError:
+        return None
+    return bigquery_storage.BigQueryReadClient()
+
+
+def _result_rows(result) -> list:
+    """Materialize a finished query's rows; items support row["col"] either way."""
+    if (result.total_rows or 0) > _BQSTORAGE_MIN_ROWS:
+        bqstorage = _bqstorage_client()
+        if bqstorage is not None:
+            return result.to_arrow(bqstorage_client=bqstorage).to_pylist()
+    return list(result)
+
+
 # ─── In-memory cache for analytics queries ───────────────────────────────────
 # Simple TTL cache to avoid redundant BigQuery calls for the same date range.
 # Cloud Run instances are ephemeral — cache lives only for the instance lifetime.
@@ -201,7 +226,7 @@ def api_events_calendar():
         body = request.get_json(silent=True) or {}
         year = int(body.get("year", datetime.now().year))
 
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
 
         # Business day SQL for PaymentDetails
         bd_sql = BUSINESS_DAY_SQL.format(dt_col="CAST(paid_date AS DATETIME)")
@@ -376,6 +401,52 @@ def api_events_calendar():
 
 
 # ─── Server Performance API ────────────────────────────────────────────────
+_DOW_ORDER = {d: i for i, d in enumerate(
+    ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+)}
+_DOW_SQL_PAID = BUSINESS_DOW_SQL.format(dt_col="CAST(paid_date AS DATETIME)")
+
+# Server summary from OrderDetails_raw
+_SERVER_ORDER_SQL = f"""
+    SELECT
+        server,
+        COUNT(DISTINCT order_id) AS orders,
+        SUM(guest_count) AS guests,
+        SUM(amount) AS revenue,
+        SUM(tip) AS tips,
+        SUM(gratuity) AS gratuity,
+        SUM(discount_amount) AS discounts,
+        COUNTIF(discount_amount > 0) AS discounted_orders,
+        SAFE_DIVIDE(SUM(amount), COUNT(DISTINCT order_id)) AS avg_check,
+        SAFE_DIVIDE(SUM(amount), NULLIF(SUM(guest_count), 0)) AS rev_per_guest,
+        SAFE_DIVIDE(SUM(tip), NULLIF(SUM(amount), 0)) * 100 AS tip_pct,
+        SAFE_DIVIDE(SUM(discount_amount), NULLIF(SUM(amount + discount_amount), 0)) * 100 AS discount_pct
+    FROM `{PROJECT_ID}.{DATASET_ID}.OrderDetails_raw`
+    WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
+        AND (voided IS NULL OR LOWER(voided) != 'true')
+        AND server IS NOT NULL AND TRIM(server) != ''
+    GROUP BY server
+    ORDER BY revenue DESC
+"""
+
+# DOW + hourly per server from PaymentDetails_raw
+_SERVER_DETAIL_SQL = f"""
+    SELECT
+        server,
+        {_DOW_SQL_PAID} AS dow,
+        EXTRACT(HOUR FROM CAST(paid_date AS DATETIME)) AS hour,
+        COUNT(*) AS txns,
+        SUM(amount) AS revenue,
+        SAFE_DIVIDE(SUM(amount), COUNT(*)) AS avg_check
+    FROM `{PROJECT_ID}.{DATASET_ID}.PaymentDetails_raw`
+    WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
+        AND status IN ('CAPTURED', 'AUTHORIZED', 'CAPTURE_IN_PROGRESS')
+        AND server IS NOT NULL AND TRIM(server) != ''
+    GROUP BY server, dow, hour
+    ORDER BY server, dow, hour
+"""
+
+
 @bp.route("/api/server-performance", methods=["POST"])
 def api_server_performance():
     """
@@ -394,49 +465,7 @@ def api_server_performance():
         if not start_date or not end_date:
             return jsonify({"error": "start_date and end_date required"}), 400
 
-        bq = bigquery.Client(project=PROJECT_ID)
-
-        # 1) Server summary from OrderDetails_raw
-        order_sql = f"""
-        SELECT
-            server,
-            COUNT(DISTINCT order_id) AS orders,
-            SUM(guest_count) AS guests,
-            SUM(amount) AS revenue,
-            SUM(tip) AS tips,
-            SUM(gratuity) AS gratuity,
-            SUM(discount_amount) AS discounts,
-            COUNTIF(discount_amount > 0) AS discounted_orders,
-            SAFE_DIVIDE(SUM(amount), COUNT(DISTINCT order_id)) AS avg_check,
-            SAFE_DIVIDE(SUM(amount), NULLIF(SUM(guest_count), 0)) AS rev_per_guest,
-            SAFE_DIVIDE(SUM(tip), NULLIF(SUM(amount), 0)) * 100 AS tip_pct,
-            SAFE_DIVIDE(SUM(discount_amount), NULLIF(SUM(amount + discount_amount), 0)) * 100 AS discount_pct
-        FROM `{PROJECT_ID}.{DATASET_ID}.OrderDetails_raw`
-        WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
-            AND (voided IS NULL OR LOWER(voided) != 'true')
-            AND server IS NOT NULL AND TRIM(server) != ''
-        GROUP BY server
-        ORDER BY revenue DESC
-        """
-
-        # 2) DOW + hourly per server from PaymentDetails_raw
-        bd_sql = BUSINESS_DAY_SQL.format(dt_col="CAST(paid_date AS DATETIME)")
-        dow_sql = BUSINESS_DOW_SQL.format(dt_col="CAST(paid_date AS DATETIME)")
-        detail_sql = f"""
-        SELECT
-            server,
-            {dow_sql} AS dow,
-            EXTRACT(HOUR FROM CAST(paid_date AS DATETIME)) AS hour,
-            COUNT(*) AS txns,
-            SUM(amount) AS revenue,
-            SAFE_DIVIDE(SUM(amount), COUNT(*)) AS avg_check
-        FROM `{PROJECT_ID}.{DATASET_ID}.PaymentDetails_raw`
-        WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
-            AND status IN ('CAPTURED', 'AUTHORIZED', 'CAPTURE_IN_PROGRESS')
-            AND server IS NOT NULL AND TRIM(server) != ''
-        GROUP BY server, dow, hour
-        ORDER BY server, dow, hour
-        """
+        bq = shared_bq_client()
 
         params = [
             bigquery.ScalarQueryParameter("start_date", "STRING", start_date),
@@ -444,8 +473,11 @@ def api_server_performance():
         ]
         job_config = bigquery.QueryJobConfig(query_parameters=params)
 
-        order_rows = list(bq.query(order_sql, job_config=job_config).result())
-        detail_rows = list(bq.query(detail_sql, job_config=job_config).result())
+        # Submit both jobs before waiting so BigQuery runs them concurrently
+        order_job = bq.query(_SERVER_ORDER_SQL, job_config=job_config)
+        detail_job = bq.query(_SERVER_DETAIL_SQL, job_config=job_config)
+        order_rows = list(order_job.result())
+        detail_rows = list(detail_job.result())
 
         # Build DOW + hourly maps per server
         dow_map: dict = {}  # server -> {dow: {revenue, orders, avg_check}}
@@ -488,11 +520,8 @@ def api_server_performance():
                 "rev_per_guest": round(float(r.rev_per_guest or 0), 2),
                 "tip_pct": round(float(r.tip_pct or 0), 1),
                 "discount_pct": round(float(r.discount_pct or 0), 1),
-                "dow": sorted(dow_map.get(srv, {}).values(), key=lambda x: [
-                    "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"
-                ].index(x["dow"]) if x["dow"] in [
-                    "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"
-                ] else 99),
+                "dow": sorted(dow_map.get(srv, {}).values(),
+                              key=lambda x: _DOW_ORDER.get(x["dow"], 99)),
                 "hourly": sorted(hourly_map.get(srv, {}).values(), key=lambda x: x["hour"]),
             })
 
@@ -521,6 +550,78 @@ def api_server_performance():
 
 
 # ─── Kitchen Speed API ─────────────────────────────────────────────────────
+# Station summary
+_KITCHEN_STATION_SQL = f"""
+    SELECT
+        station,
+        COUNT(*) AS tickets,
+        COUNTIF(fulfilled_date IS NOT NULL) AS fulfilled,
+        AVG(CASE WHEN fulfilled_date IS NOT NULL THEN
+            TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS avg_sec,
+        APPROX_QUANTILES(
+            CASE WHEN fulfilled_date IS NOT NULL THEN
+            TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END, 100
+        )[OFFSET(50)] AS median_sec,
+        MIN(CASE WHEN fulfilled_date IS NOT NULL THEN
+            TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS min_sec,
+        MAX(CASE WHEN fulfilled_date IS NOT NULL THEN
+            TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS max_sec,
+        SAFE_DIVIDE(COUNTIF(fulfilled_date IS NOT NULL), COUNT(*)) * 100 AS fulfillment_pct
+    FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
+    WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
+        AND fired_date IS NOT NULL
+        AND station IS NOT NULL AND TRIM(station) != ''
+    GROUP BY station
+    ORDER BY avg_sec ASC
+"""
+
+# Hourly profile
+_KITCHEN_HOURLY_SQL = f"""
+    SELECT
+        EXTRACT(HOUR FROM CAST(fired_date AS DATETIME)) AS hour,
+        COUNT(*) AS tickets,
+        AVG(CASE WHEN fulfilled_date IS NOT NULL THEN
+            TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS avg_sec
+    FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
+    WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
+        AND fired_date IS NOT NULL
+    GROUP BY hour
+    ORDER BY hour
+"""
+
+# Cook summary
+_KITCHEN_COOK_SQL = f"""
+    SELECT
+        fulfilled_by AS cook,
+        COUNT(*) AS tickets,
+        AVG(TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND)) AS avg_sec,
+        MIN(TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND)) AS min_sec
+    FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
+    WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
+        AND fulfilled_date IS NOT NULL
+        AND fired_date IS NOT NULL
+        AND fulfilled_by IS NOT NULL AND TRIM(fulfilled_by) != ''
+    GROUP BY cook
+    ORDER BY avg_sec ASC
+"""
+
+# Weekly trend
+_BD_SQL_CHECK_OPENED = BUSINESS_DAY_SQL.format(dt_col="CAST(check_opened AS DATETIME)")
+_KITCHEN_WEEKLY_SQL = f"""
+    SELECT
+        FORMAT_DATE('%Y-%m-%d', DATE_TRUNC({_BD_SQL_CHECK_OPENED}, WEEK(MONDAY))) AS week,
+        COUNT(*) AS tickets,
+        COUNTIF(fulfilled_date IS NOT NULL) AS fulfilled,
+        AVG(CASE WHEN fulfilled_date IS NOT NULL THEN
+            TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS avg_sec
+    FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
+    WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
+        AND fired_date IS NOT NULL
+    GROUP BY week
+    ORDER BY week
+"""
+
+
 @bp.route("/api/kitchen-speed", methods=["POST"])
 def api_kitchen_speed():
     """
@@ -539,7 +640,7 @@ def api_kitchen_speed():
         if not start_date or not end_date:
             return jsonify({"error": "start_date and end_date required"}), 400
 
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
 
         params = [
             bigquery.ScalarQueryParameter("start_date", "STRING", start_date),
@@ -547,81 +648,15 @@ def api_kitchen_speed():
         ]
         job_config = bigquery.QueryJobConfig(query_parameters=params)
 
-        # 1) Station summary
-        station_sql = f"""
-        SELECT
-            station,
-            COUNT(*) AS tickets,
-            COUNTIF(fulfilled_date IS NOT NULL) AS fulfilled,
-            AVG(CASE WHEN fulfilled_date IS NOT NULL THEN
-                TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS avg_sec,
-            APPROX_QUANTILES(
-                CASE WHEN fulfilled_date IS NOT NULL THEN
-                TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END, 100
-            )[OFFSET(50)] AS median_sec,
-            MIN(CASE WHEN fulfilled_date IS NOT NULL THEN
-                TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS min_sec,
-            MAX(CASE WHEN fulfilled_date IS NOT NULL THEN
-                TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS max_sec,
-            SAFE_DIVIDE(COUNTIF(fulfilled_date IS NOT NULL), COUNT(*)) * 100 AS fulfillment_pct
-        FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
-        WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
-            AND fired_date IS NOT NULL
-            AND station IS NOT NULL AND TRIM(station) != ''
-        GROUP BY station
-        ORDER BY avg_sec ASC
-        """
-
-        # 2) Hourly profile
-        hourly_sql = f"""
-        SELECT
-            EXTRACT(HOUR FROM CAST(fired_date AS DATETIME)) AS hour,
-            COUNT(*) AS tickets,
-            AVG(CASE WHEN fulfilled_date IS NOT NULL THEN
-                TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS avg_sec
-        FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
-        WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
-            AND fired_date IS NOT NULL
-        GROUP BY hour
-        ORDER BY hour
-        """
-
-        # 3) Cook summary
-        cook_sql = f"""
-        SELECT
-            fulfilled_by AS cook,
-            COUNT(*) AS tickets,
-            AVG(TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND)) AS avg_sec,
-            MIN(TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND)) AS min_sec
-        FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
-        WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
-            AND fulfilled_date IS NOT NULL
-            AND fired_date IS NOT NULL
-            AND fulfilled_by IS NOT NULL AND TRIM(fulfilled_by) != ''
-        GROUP BY cook
-        ORDER BY avg_sec ASC
-        """
-
-        # 4) Weekly trend
-        bd_sql = BUSINESS_DAY_SQL.format(dt_col="CAST(check_opened AS DATETIME)")
-        weekly_sql = f"""
-        SELECT
-            FORMAT_DATE('%Y-%m-%d', DATE_TRUNC({bd_sql}, WEEK(MONDAY))) AS week,
-            COUNT(*) AS tickets,
-            COUNTIF(fulfilled_date IS NOT NULL) AS fulfilled,
-            AVG(CASE WHEN fulfilled_date IS NOT NULL THEN
-                TIMESTAMP_DIFF(CAST(fulfilled_date AS DATETIME), CAST(fired_date AS DATETIME), SECOND) END) AS avg_sec
-        FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
-        WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
-            AND fired_date IS NOT NULL
-        GROUP BY week
-        ORDER BY week
-        """
-
-        station_rows = list(bq.query(station_sql, job_config=job_config).result())
-        hourly_rows = list(bq.query(hourly_sql, job_config=job_config).result())
-        cook_rows = list(bq.query(cook_sql, job_config=job_config).result())
-        weekly_rows = list(bq.query(weekly_sql, job_config=job_config).result())
+        # Submit all four jobs before waiting so BigQuery runs them concurrently
+        station_job = bq.query(_KITCHEN_STATION_SQL, job_config=job_config)
+        hourly_job = bq.query(_KITCHEN_HOURLY_SQL, job_config=job_config)
+        cook_job = bq.query(_KITCHEN_COOK_SQL, job_config=job_config)
+        weekly_job = bq.query(_KITCHEN_WEEKLY_SQL, job_config=job_config)
+        station_rows = list(station_job.result())
+        hourly_rows = list(hourly_job.result())
+        cook_rows = list(cook_job.result())
+        weekly_rows = list(weekly_job.result())
 
         stations = [{
             "station": r.station,
@@ -700,7 +735,7 @@ def api_labor_analysis():
         if not start_date or not end_date:
             return jsonify({"error": "start_date and end_date required"}), 400
 
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
 
         # Q1: Weekly revenue from OrderDetails_raw
         rev_sql = f"""
@@ -908,7 +943,7 @@ def api_menu_engineering():
         if not start_date or not end_date:
             return jsonify({"error": "start_date and end_date required"}), 400
 
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
         bd = BUSINESS_DAY_SQL.format(dt_col="CAST(order_date AS DATETIME)")
 
         base_filter = (
@@ -1075,7 +1110,7 @@ def api_customer_loyalty():
         if not start_date or not end_date:
             return jsonify({"error": "start_date and end_date required"}), 400
 
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
                 bigquery.ScalarQueryParameter("start", "DATE", start_date),
@@ -1216,10 +1251,13 @@ def api_customer_loyalty():
             SELECT *, ROW_NUMBER() OVER (
               PARTITION BY check_id ORDER BY processing_date DESC
             ) AS _rn
-            FROM `{PROJECT_ID}.{DATASET_ID}.CheckDetails_raw`
-            WHERE customer_id IS NOT NULL AND customer_id != ''
-              AND PARSE_DATE('%m/%d/%y', opened_date)
-                  BETWEEN @start AND @end
+            FROM (
+              -- Parse the M/D/YY string once per row; reused below
+              SELECT *, PARSE_DATE('%m/%d/%y', opened_date) AS opened_day
+              FROM `{PROJECT_ID}.{DATASET_ID}.CheckDetails_raw`
+              WHERE customer_id IS NOT NULL AND customer_id != ''
+            )
+            WHERE opened_day BETWEEN @start AND @end
           ) WHERE _rn = 1
         ),
         pay_link AS (
@@ -1241,11 +1279,9 @@ def api_customer_loyalty():
           COUNT(DISTINCT cd.check_id) AS visits,
           ROUND(SUM(CAST(cd.total AS FLOAT64)), 2) AS total_spend,
           ROUND(AVG(CAST(cd.total AS FLOAT64)), 2) AS avg_check,
-          MIN(PARSE_DATE('%m/%d/%y', cd.opened_date)) AS first_visit,
-          MAX(PARSE_DATE('%m/%d/%y', cd.opened_date)) AS last_visit,
-          DATE_DIFF(@end,
-            MAX(PARSE_DATE('%m/%d/%y', cd.opened_date)), DAY
-          ) AS recency_days,
+          MIN(cd.opened_day) AS first_visit,
+          MAX(cd.opened_day) AS last_visit,
+          DATE_DIFF(@end, MAX(cd.opened_day), DAY) AS recency_days,
           MAX(pl.last_4_card_digits) AS linked_card,
           MAX(pl.card_type) AS linked_card_type
         FROM check_deduped cd
@@ -1559,7 +1595,7 @@ def api_guest_export():
         if not start_date or not end_date:
             return jsonify({"error": "start_date and end_date required"}), 400
 
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
                 bigquery.ScalarQueryParameter("start", "DATE", start_date),
@@ -1573,10 +1609,13 @@ def api_guest_export():
             SELECT *, ROW_NUMBER() OVER (
               PARTITION BY check_id ORDER BY processing_date DESC
             ) AS _rn
-            FROM `{PROJECT_ID}.{DATASET_ID}.CheckDetails_raw`
-            WHERE customer_id IS NOT NULL AND customer_id != ''
-              AND PARSE_DATE('%m/%d/%y', opened_date)
-                  BETWEEN @start AND @end
+            FROM (
+              -- Parse the M/D/YY string once per row; reused below
+              SELECT *, PARSE_DATE('%m/%d/%y', opened_date) AS opened_day
+              FROM `{PROJECT_ID}.{DATASET_ID}.CheckDetails_raw`
+              WHERE customer_id IS NOT NULL AND customer_id != ''
+            )
+            WHERE opened_day BETWEEN @start AND @end
           ) WHERE _rn = 1
         ),
         pay_link AS (
@@ -1598,11 +1637,9 @@ def api_guest_export():
           COUNT(DISTINCT cd.check_id) AS visits,
           ROUND(SUM(CAST(cd.total AS FLOAT64)), 2) AS total_spend,
           ROUND(AVG(CAST(cd.total AS FLOAT64)), 2) AS avg_check,
-          MIN(PARSE_DATE('%m/%d/%y', cd.opened_date)) AS first_visit,
-          MAX(PARSE_DATE('%m/%d/%y', cd.opened_date)) AS last_visit,
-          DATE_DIFF(@end,
-            MAX(PARSE_DATE('%m/%d/%y', cd.opened_date)), DAY
-          ) AS recency_days,
+          MIN(cd.opened_day) AS first_visit,
+          MAX(cd.opened_day) AS last_visit,
+          DATE_DIFF(@end, MAX(cd.opened_day), DAY) AS recency_days,
           MAX(pl.last_4_card_digits) AS linked_card,
           MAX(pl.card_type) AS linked_card_type
         FROM check_deduped cd
@@ -1611,7 +1648,7 @@ def api_guest_export():
         ORDER BY total_spend DESC
         """
 
-        rows = list(bq.query(q, job_config=job_config).result())
+        rows = _result_rows(bq.query(q, job_config=job_config).result())
 
         def clean_phone(raw):
             if not raw:
@@ -1651,18 +1688,18 @@ def api_guest_export():
         ])
 
         for r in rows:
-            name = (r.name or "").strip()
+            name = (r["name"] or "").strip()
             parts = name.split(None, 1)
             first = parts[0] if parts else ""
             last = parts[1] if len(parts) > 1 else ""
-            email = (r.email or "").strip()
-            phone = clean_phone(r.phone)
+            email = (r["email"] or "").strip()
+            phone = clean_phone(r["phone"])
             if not email and not phone:
                 continue
-            vd = r.visits or 0
-            rec = r.recency_days or 0
+            vd = r["visits"] or 0
+            rec = r["recency_days"] or 0
             seg = classify_seg(vd, rec)
-            spend = float(r.total_spend or 0)
+            spend = float(r["total_spend"] or 0)
 
             # Build tags
             tags = [seg]
@@ -1678,9 +1715,9 @@ def api_guest_export():
 
             writer.writerow([
                 first, last, email, phone,
-                vd, f"{spend:.2f}", f"{float(r.avg_check or 0):.2f}",
-                str(r.first_visit) if r.first_visit else "",
-                str(r.last_visit) if r.last_visit else "",
+                vd, f"{spend:.2f}", f"{float(r['avg_check'] or 0):.2f}",
+                str(r["first_visit"]) if r["first_visit"] else "",
+                str(r["last_visit"]) if r["last_visit"] else "",
                 seg, "; ".join(tags),
             ])
 
@@ -1855,7 +1892,7 @@ def api_kpi_benchmarks():
         WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @sd) AND PARSE_DATE('%Y-%m-%d', @ed)
           AND (voided IS NULL OR voided = 'false')
         """
-        rev_row = list(bq_client.query(rev_q, job_config=period_params).result())[0]
+        rev_row = next(iter(bq_client.query(rev_q, job_config=period_params).result(max_results=1)))
         net_sales = float(rev_row.net_sales or 0)
         total_tips = float(rev_row.total_tips or 0)
         total_grat = float(rev_row.total_gratuity or 0)
@@ -1880,7 +1917,7 @@ def api_kpi_benchmarks():
         WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @sd) AND PARSE_DATE('%Y-%m-%d', @ed)
           AND voided = 'true'
         """
-        void_row = list(bq_client.query(void_q, job_config=period_params).result())[0]
+        void_row = next(iter(bq_client.query(void_q, job_config=period_params).result(max_results=1)))
         voided_amount = float(void_row.voided_amount or 0)
         gross_for_void = net_sales + voided_amount
         void_rate = round(voided_amount / gross_for_void * 100, 1) if gross_for_void > 0 else 0
@@ -1978,7 +2015,7 @@ def api_kpi_benchmarks():
           COUNTIF(visit_days >= 3 AND recency > 45 AND recency <= 90) AS at_risk_count
         FROM cards
         """
-        guest_row = list(bq_client.query(guest_q, job_config=period_params).result())[0]
+        guest_row = next(iter(bq_client.query(guest_q, job_config=period_params).result(max_results=1)))
         total_guests = int(guest_row.total_guests or 0)
         repeat_guests = int(guest_row.repeat_guests or 0)
         total_guest_rev = float(guest_row.total_revenue or 0)
@@ -2027,7 +2064,7 @@ def api_kpi_benchmarks():
         if not start_date or not end_date:
             return jsonify({"error": "start_date and end_date required"}), 400
 
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
 
         # Current period
         current = _run_period(bq, start_date, end_date)
@@ -2312,7 +2349,7 @@ def api_budget():
         return jsonify({"error": "Invalid month format. Use YYYY-MM."}), 400
 
     try:
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         date_params = bigquery.QueryJobConfig(query_parameters=[
             bigquery.ScalarQueryParameter("start_date", "STRING", start_date),
             bigquery.ScalarQueryParameter("end_date", "STRING", end_date),
@@ -2329,7 +2366,7 @@ def api_budget():
         WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
             AND (voided IS NULL OR voided = 'false')
         """
-        rev_row = list(bq_client.query(rev_q, job_config=date_params).result())[0]
+        rev_row = next(iter(bq_client.query(rev_q, job_config=date_params).result(max_results=1)))
         net_sales = float(rev_row.net_sales or 0)
         total_tips = float(rev_row.total_tips or 0)
         total_gratuity = float(rev_row.total_gratuity or 0)
@@ -2348,7 +2385,7 @@ def api_budget():
         WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
             AND (voided IS NULL OR voided = 'false')
         """
-        rev_cat_row = list(bq_client.query(rev_cat_q, job_config=date_params).result())[0]
+        rev_cat_row = next(iter(bq_client.query(rev_cat_q, job_config=date_params).result(max_results=1)))
         food_rev = round(float(rev_cat_row.food_rev or 0), 2)
         liquor_rev = round(float(rev_cat_row.liquor_rev or 0), 2)
 
@@ -2360,7 +2397,7 @@ def api_budget():
             AND LOWER(category) LIKE '%hookah sales%'
             AND amount > 0
         """
-        hookah_row = list(bq_client.query(hookah_bank_q, job_config=date_params).result())[0]
+        hookah_row = next(iter(bq_client.query(hookah_bank_q, job_config=date_params).result(max_results=1)))
         hookah_rev = round(float(hookah_row.hookah_rev or 0), 2)
         other_rev = round(max(net_sales - food_rev - liquor_rev, 0), 2)
         # Hookah is additive (bank deposits, not in Toast net_sales)
@@ -2929,7 +2966,7 @@ def api_budget_drilldown():
     kw_where = "(" + " OR ".join(kw_clauses) + ")"
 
     try:
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         q = f"""
         SELECT
             transaction_date,
@@ -2997,7 +3034,7 @@ def api_event_roi():
     end_date = data["end_date"]
 
     try:
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
 
         # Build business-day SQL for PaymentDetails (paid_date is STRING)
         bd = BUSINESS_DAY_SQL.format(dt_col="CAST(paid_date AS DATETIME)")
@@ -3543,7 +3580,7 @@ def api_menu_mix():
     end_date = data["end_date"]
 
     try:
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         bd = BUSINESS_DAY_SQL.format(dt_col="CAST(order_date AS DATETIME)")
 
         base_filter = (
@@ -3827,7 +3864,7 @@ def api_cash_recon():
     end_date = data["end_date"]
 
     try:
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
 
         pos_query = f"""
         SELECT
@@ -4088,7 +4125,7 @@ def profit_summary():
     start_date, end_date = result
 
     try:
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
 
         revenue_query = f"""
         SELECT
@@ -4106,7 +4143,7 @@ def profit_summary():
             bigquery.ScalarQueryParameter("start_date", "STRING", start_date),
             bigquery.ScalarQueryParameter("end_date", "STRING", end_date),
         ])
-        rev_row = list(bq_client.query(revenue_query, job_config=date_params).result())[0]
+        rev_row = next(iter(bq_client.query(revenue_query, job_config=date_params).result(max_results=1)))
         net_sales = float(rev_row.net_sales or 0)
         gross_revenue = float(rev_row.gross_revenue or 0)
         total_tips = float(rev_row.total_tips or 0)
@@ -4125,7 +4162,7 @@ def profit_summary():
         FROM `{PROJECT_ID}.{DATASET_ID}.PaymentDetails_raw`
         WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
         """
-        cash_row = list(bq_client.query(cash_query, job_config=date_params).result())[0]
+        cash_row = next(iter(bq_client.query(cash_query, job_config=date_params).result(max_results=1)))
         cash_collected = float(cash_row.cash_collected or 0)
         cash_txn_count = int(cash_row.cash_txn_count or 0)
 
@@ -4140,7 +4177,7 @@ def profit_summary():
         FROM `{PROJECT_ID}.{DATASET_ID}.CashEntries_raw`
         WHERE processing_date BETWEEN PARSE_DATE('%Y-%m-%d', @start_date) AND PARSE_DATE('%Y-%m-%d', @end_date)
         """
-        drawer_row = list(bq_client.query(drawer_query, job_config=date_params).result())[0]
+        drawer_row = next(iter(bq_client.query(drawer_query, job_config=date_params).result(max_results=1)))
         drawer_collected = float(drawer_row.drawer_collected or 0)
         drawer_payouts = float(drawer_row.payouts or 0)
         drawer_overages = float(drawer_row.overages or 0)
@@ -4188,7 +4225,7 @@ def profit_summary():
                      OR LOWER(category) LIKE '%cash account transfer%'
                      OR LOWER(description) LIKE '%counter credit%')
             """
-            dep_row = list(bq_client.query(deposit_query, job_config=date_params).result())[0]
+            dep_row = next(iter(bq_client.query(deposit_query, job_config=date_params).result(max_results=1)))
             cash_deposited = float(dep_row.total_deposits or 0)
 
         def sum_matching(expenses: Dict[str, float], keywords: List[str]) -> float:
@@ -4383,7 +4420,7 @@ def upload_check_register():
 
     try:
         file_content = uploaded.read()
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         register = CheckRegisterSync(bq_client, DATASET_ID)
         count = register.load_from_csv(file_content)
         return jsonify({
@@ -4403,7 +4440,7 @@ def upload_check_register():
 def reconcile_checks():
     """Re-categorize uncategorized Check transactions using the current register."""
     try:
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
 
         # Sheet sync removed 2026-08-01 — lookup reads the CheckRegister
         # table, which the lov3checks app keeps current.
@@ -4453,28 +4490,40 @@ def reconcile_checks():
                 "message": "All uncategorized checks lack register entries or matching rules.",
             })
 
-        reconciled = 0
-        for u in updates:
-            uq = f"""
-                UPDATE `{PROJECT_ID}.{DATASET_ID}.BankTransactions_raw`
-                SET category = @category,
-                    category_source = @source,
-                    vendor_normalized = @vendor
-                WHERE transaction_date = PARSE_DATE('%Y-%m-%d', @txn_date)
-                  AND description = @desc
-                  AND amount = @amt
-            """
-            params = [
-                bigquery.ScalarQueryParameter("category", "STRING", u["category"]),
-                bigquery.ScalarQueryParameter("source", "STRING", u["category_source"]),
-                bigquery.ScalarQueryParameter("vendor", "STRING", u["vendor_normalized"]),
+        # One UPDATE joined against all resolved checks, instead of a DML
+        # job per check. BigQuery rejects an UPDATE where a target row
+        # matches more than one source row, so collapse duplicate keys.
+        by_key = {
+            (u["transaction_date"], u["description"], u["amount"]): u
+            for u in updates
+        }
+        uq = f"""
+            UPDATE `{PROJECT_ID}.{DATASET_ID}.BankTransactions_raw` t
+            SET category = u.category,
+                category_source = u.category_source,
+                vendor_normalized = u.vendor_normalized
+            FROM UNNEST(@updates) u
+            WHERE t.transaction_date = PARSE_DATE('%Y-%m-%d', u.txn_date)
+              AND t.description = u.description
+              AND t.amount = u.amount
+        """
+        structs = [
+            bigquery.StructQueryParameter(
+                None,
                 bigquery.ScalarQueryParameter("txn_date", "STRING", u["transaction_date"]),
-                bigquery.ScalarQueryParameter("desc", "STRING", u["description"]),
-                bigquery.ScalarQueryParameter("amt", "FLOAT64", u["amount"]),
-            ]
-            job_config = bigquery.QueryJobConfig(query_parameters=params)
-            bq_client.query(uq, job_config=job_config).result()
-            reconciled += 1
+                bigquery.ScalarQueryParameter("description", "STRING", u["description"]),
+                bigquery.ScalarQueryParameter("amount", "FLOAT64", u["amount"]),
+                bigquery.ScalarQueryParameter("category", "STRING", u["category"]),
+                bigquery.ScalarQueryParameter("category_source", "STRING", u["category_source"]),
+                bigquery.ScalarQueryParameter("vendor_normalized", "STRING", u["vendor_normalized"]),
+            )
+            for u in by_key.values()
+        ]
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ArrayQueryParameter("updates", "STRUCT", structs),
+        ])
+        bq_client.query(uq, job_config=job_config).result()
+        reconciled = len(updates)
 
         return jsonify({
             "status": "success",
@@ -4997,7 +5046,7 @@ def api_promoter_payout_fetch_sales():
         return jsonify({"error": str(e)}), 400
 
     try:
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
 
         # Filter by ORDER_DATE (when the order was opened), not sent_date or
         # paid_date — this matches Toast's Sales Summary UI ("Custom hours" filter).
@@ -5194,7 +5243,7 @@ def api_promoter_payout_save():
     table_ref = f"{PROJECT_ID}.{DATASET_ID}.{PROMOTER_PAYOUT_TABLE}"
 
     try:
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
 
         # Delete existing row if updating (MERGE is heavier; row count is tiny)
         if data.get("payout_id"):
@@ -5259,7 +5308,7 @@ def api_promoter_payout_history():
     """
 
     try:
-        bq = bigquery.Client(project=PROJECT_ID)
+        bq = shared_bq_client()
         job_config = bigquery.QueryJobConfig(query_parameters=params)
         rows = list(bq.query(sql, job_config=job_config).result())
         payouts = []
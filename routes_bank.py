@@ -12,7 +12,9 @@ from google.cloud import bigquery
 
 from config import PROJECT_ID, DATASET_ID
 from models import BankUploadResult
-from services import BofACSVParser, BankCategoryManager, CheckRegisterSync, BigQueryLoader
+from services import (
+    BofACSVParser, BankCategoryManager, CheckRegisterSync, BigQueryLoader, shared_bq_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +45,7 @@ def upload_bank_csv():
         # Deterministic batch_id from file content for idempotent re-uploads
         batch_id = hashlib.sha256(file_content).hexdigest()[:16]
 
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         loader = BigQueryLoader(bq_client, DATASET_ID)
         cat_manager = BankCategoryManager(bq_client, DATASET_ID)
 
@@ -185,7 +187,7 @@ def bank_categories():
       Body for delete: {"action": "delete", "keyword": "SYSCO"}
     """
     try:
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         manager = BankCategoryManager(bq_client, DATASET_ID)
 
         if request.method == "GET":
@@ -253,7 +255,7 @@ def api_bank_transactions():
         date_from = request.args.get("date_from", "")
         date_to = request.args.get("date_to", "")
 
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         table = f"`{PROJECT_ID}.{DATASET_ID}.BankTransactions_raw`"
 
         # Build WHERE clauses
@@ -298,7 +300,7 @@ def api_bank_transactions():
             COUNT(*) AS total_count
         FROM {table}
         """
-        summary_row = list(bq_client.query(summary_sql).result())[0]
+        summary_row = next(iter(bq_client.query(summary_sql).result(max_results=1)))
 
         # Upload metadata — last upload date, newest transaction
         meta_sql = f"""
@@ -308,7 +310,7 @@ def api_bank_transactions():
             MIN(transaction_date) AS oldest_transaction_date
         FROM {table}
         """
-        meta_row = list(bq_client.query(meta_sql).result())[0]
+        meta_row = next(iter(bq_client.query(meta_sql).result(max_results=1)))
         last_upload_date = str(meta_row.last_upload_date) if meta_row.last_upload_date else None
         newest_txn_date = str(meta_row.newest_transaction_date) if meta_row.newest_transaction_date else None
         oldest_txn_date = str(meta_row.oldest_transaction_date) if meta_row.oldest_transaction_date else None
@@ -347,7 +349,7 @@ def api_bank_transactions():
         # Filtered count
         count_sql = f"SELECT COUNT(*) AS cnt FROM {table}{where_sql}"
         job_cfg = bigquery.QueryJobConfig(query_parameters=params[:])
-        filtered_count = list(bq_client.query(count_sql, job_config=job_cfg).result())[0].cnt
+        filtered_count = next(iter(bq_client.query(count_sql, job_config=job_cfg).result(max_results=1))).cnt
 
         # Paginated rows
         rows_sql = f"""
@@ -425,7 +427,7 @@ def api_bank_transactions_categorize():
         if not updates:
             return jsonify({"error": "No updates provided"}), 400
 
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         table = f"`{PROJECT_ID}.{DATASET_ID}.BankTransactions_raw`"
         cat_manager = BankCategoryManager(bq_client, DATASET_ID)
 
@@ -535,7 +537,7 @@ def api_bank_transactions_delete():
 
         logger.info(f"Delete request received with {len(deletes)} item(s): {json.dumps(deletes[:3])}")
 
-        bq_client = bigquery.Client(project=PROJECT_ID)
+        bq_client = shared_bq_client()
         table = f"`{PROJECT_ID}.{DATASET_ID}.BankTransactions_raw`"
 
         deleted = 0
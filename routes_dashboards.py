@@ -115,14 +115,14 @@ def promoter_payout_page():
     return Response(_promoter_payout_html(), mimetype="text/html")
 
 
-from google.cloud import bigquery
 from q1_report import Q1ReportGenerator
+from services import shared_bq_client
 
 
 @bp.route("/q1-report", methods=["GET"])
 def q1_report_html():
     """Q1 2026 leadership financial report — HTML."""
-    client = bigquery.Client(project="toast-analytics-444116")
+    client = shared_bq_client()
     gen = Q1ReportGenerator(client)
     data = gen.fetch()
     return Response(gen.render_html(data), mimetype="text/html")
@@ -131,7 +131,7 @@ def q1_report_html():
 @bp.route("/q1-report.md", methods=["GET"])
 def q1_report_markdown():
     """Q1 2026 leadership financial report — Markdown."""
-    client = bigquery.Client(project="toast-analytics-444116")
+    client = shared_bq_client()
     gen = Q1ReportGenerator(client)
     data = gen.fetch()
     return Response(gen.render_markdown(data), mimetype="text/markdown")
@@ -147,7 +147,7 @@ def prime_cost_html():
     no hardcoded dates, updates every request.
     """
     from prime_cost import PrimeCostCalculator, render_html
-    client = bigquery.Client(project="toast-analytics-444116")
+    client = shared_bq_client()
     calc = PrimeCostCalculator(client)
     trailing = calc.compute_trailing_months(months_back=12)
     current = calc.compute_partial_current_month()
@@ -164,7 +164,7 @@ def comps_html():
     industry benchmarks. Backs the Tuesday leadership Slack report.
     """
     from comp_analytics import CompAnalytics, render_html
-    client = bigquery.Client(project="toast-analytics-444116")
+    client = shared_bq_client()
     analytics = CompAnalytics(client)
     cur = analytics.compute_last_week()
     prev = analytics.compute_prior_week()
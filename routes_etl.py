@@ -6,11 +6,11 @@ from datetime import datetime, timedelta
 from functools import wraps
 
 from flask import Blueprint, request, jsonify
-from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
 
 from config import PROJECT_ID, DATASET_ID
 from pipeline import ToastPipeline
+from services import shared_bq_client
 from weekly_report import WeeklyReportGenerator
 from gratuity_report import GratuityReportGenerator
 
@@ -64,7 +64,8 @@ def run_pipeline():
     Request body:
     {
         "processing_date": "20250129",  // optional, defaults to yesterday
-        "backfill_days": 0  // optional, number of days to backfill
+        "backfill_days": 0,  // optional, number of days to backfill
+        "force": false  // optional, reload dates whose SFTP files are unchanged
     }
     """
     data = request.get_json(silent=True) or {}
@@ -73,7 +74,7 @@ def run_pipeline():
     backfill_days = data.get("backfill_days", 0)
 
     pipeline = ToastPipeline()
-    summary = pipeline.run(processing_date, backfill_days)
+    summary = pipeline.run(processing_date, backfill_days, force=bool(data.get("force", False)))
 
     # Load labor time entries for the same date
     labor_result = {}
@@ -111,8 +112,13 @@ def backfill():
     Request body:
     {
         "start_date": "20250101",
-        "end_date": "20250129"
+        "end_date": "20250129",
+        "skip_unchanged": false  // optional, skip dates whose SFTP files are unchanged
+                                 // since their last clean load
     }
+
+    Every date is reloaded by default, so a backfill can repair data on the
+    BigQuery side even when Toast's export hasn't changed.
     """
     data = request.get_json()
 
@@ -128,12 +134,14 @@ def backfill():
     days = (end_date - start_date).days
 
     pipeline = ToastPipeline()
-    summary = pipeline.run(data["end_date"], backfill_days=days)
+    skip_unchanged = bool(data.get("skip_unchanged", False))
+    summary = pipeline.run(data["end_date"], backfill_days=days, force=not skip_unchanged)
 
     return jsonify({
         "run_id": summary.run_id,
         "status": summary.status,
         "date_range": f"{data['start_date']} to {data['end_date']}",
+        "skip_unchanged": skip_unchanged,
         "files_processed": summary.files_processed,
         "total_rows": summary.total_rows,
         "errors": summary.errors
@@ -144,16 +152,16 @@ def backfill():
 def table_status(table_loc: str):
     """Get status of a specific table"""
     try:
-        client = bigquery.Client(project=PROJECT_ID)
+        client = shared_bq_client()
         table_ref = f"{PROJECT_ID}.{DATASET_ID}.{table_loc}"
         table = client.get_table(table_ref)
 
-        # Get latest processing date
+        # Get latest processing date (row count already comes from table metadata)
         query = f"""
-        SELECT MAX(processing_date) as latest_date, COUNT(*) as total_rows
+        SELECT MAX(processing_date) as latest_date
         FROM `{table_ref}`
         """
-        result = list(client.query(query).result())[0]
+        result = next(iter(client.query(query).result(max_results=1)))
 
         return jsonify({
             "table": table_loc,
@@ -7,11 +7,17 @@ schema validation, alerting, and category management.
 
 import io
 import re
+import time
+import hashlib
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
 
 import paramiko
+import numpy as np
 import pandas as pd
 from google.cloud import bigquery, secretmanager
 from google.cloud.exceptions import NotFound
@@ -26,6 +32,65 @@ from models import PipelineResult, PipelineRunSummary
 
 logger = logging.getLogger(__name__)
 
+# Bank description patterns, compiled once at import — these run for every
+# row of every uploaded statement.
+_WIRE_BNF_RE = re.compile(r"BNF:([^/]+?)\s*ID:")
+_WIRE_ORIG_RE = re.compile(r"ORIG:\d*/([^/]+?)\s*ID:")
+_ZELLE_RE = re.compile(
+    r'(?i)^Zelle\s+payment\s+(?:to|from)\s+'   # prefix
+    r'(.+?)'                                     # payee (non-greedy)
+    r'(?:\s+for\s+.*|\s+Conf#.*|[";]+.*)$'      # stop at "for", "Conf#", or quote artifacts
+)
+_ACH_PREFIX_RE = re.compile(r"(?i)^ACH\s+(?:Debit|Credit|Hold)\s+")
+_PURCHASE_PREFIX_RE = re.compile(r"(?i)^PURCHASE\s+(?:AUTHORIZED\s+)?ON\s+\d{2}/\d{2}\s+")
+_CHECKCARD_PREFIX_RE = re.compile(r"(?i)^CHECKCARD\s+\d{4}\s+")
+_TRAILING_ID_RE = re.compile(r"\s+ID:\S*$")
+_TRAILING_CONF_RE = re.compile(r"\s+Conf#.*$")
+_CHECK_DESC_RE = re.compile(r"(?i)^check\s+(\d+)$")
+_TOAST_SETTLEMENT_RE = re.compile(r"TOAST,?\s*INC\.?\s+DES:\d{8}")
+_TOAST_PLATFORM_RE = re.compile(r"TOAST,?\s*INC\s+DES:TOAST")
+_DIGITS_RE = re.compile(r"\d+")
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+
+# Datetime layouts seen in Toast exports, tried in order
+_TOAST_DATETIME_FORMATS = (
+    "%m/%d/%y %I:%M %p",
+    "%m/%d/%y %I:%M:%S %p",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %I:%M:%S %p",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+# Toast header characters → BigQuery-safe column name pieces
+_COLUMN_NAME_TRANS = str.maketrans({
+    ' ': '_', '#': 'number', '?': None, '/': '_',
+    '(': None, ')': None, '-': '_', '.': '_',
+})
+_INVALID_COLUMN_CHARS_RE = re.compile(r'[^a-z0-9_]')
+
+# Toast boolean spellings → the 'true'/'false' strings loaded into BigQuery
+_BOOL_STRINGS = {
+    'true': 'true', 'yes': 'true', '1': 'true', 'y': 'true',
+    'false': 'false', 'no': 'false', '0': 'false', 'n': 'false',
+}
+
+
+@lru_cache(maxsize=512)
+def _keyword_pattern(keyword: str) -> "re.Pattern[str]":
+    """Compile a category-rule keyword into a whole-word pattern (cached)."""
+    return re.compile(r"\b" + re.escape(keyword) + r"\b")
+
+
+@lru_cache(maxsize=1)
+def shared_bq_client() -> bigquery.Client:
+    """BigQuery client shared by the route blueprints, built once per process.
+
+    Client construction resolves credentials and sets up an HTTP session;
+    the client itself is safe to share across request threads.
+    """
+    return bigquery.Client(project=PROJECT_ID)
+
 
 class BofACSVParser:
     """Parses Bank of America CSV exports and auto-categorizes transactions"""
@@ -115,17 +180,15 @@ class BofACSVParser:
             df["running_balance"] = None
 
         # Derived columns
-        df["transaction_type"] = df["amount"].apply(
-            lambda x: "credit" if pd.notna(x) and x >= 0 else "debit"
-        )
+        df["transaction_type"] = np.where(df["amount"] >= 0, "credit", "debit")
         df["abs_amount"] = df["amount"].abs()
 
         # Auto-categorize
         df["description"] = df["description"].fillna("").str.strip()
-        categories = df["description"].apply(self._categorize)
-        df["category"] = categories.apply(lambda x: x[0])
-        df["category_source"] = categories.apply(lambda x: x[1])
-        df["vendor_normalized"] = categories.apply(lambda x: x[2])
+        categories = [self._categorize(d) for d in df["description"]]
+        df["category"] = [c[0] for c in categories]
+        df["category_source"] = [c[1] for c in categories]
+        df["vendor_normalized"] = [c[2] for c in categories]
 
         # Metadata
         df["source_file"] = source_filename
@@ -156,14 +219,13 @@ class BofACSVParser:
         """
         if "WIRE TYPE:" not in description.upper():
             return None
-        import re
 
         # Outbound: BNF:GREATLAND INVESTMENT INC. ID:...
-        bnf = re.search(r"BNF:([^/]+?)\s*ID:", description)
+        bnf = _WIRE_BNF_RE.search(description)
         if bnf:
             return bnf.group(1).strip()
         # Inbound: ORIG:1/DERWIN ALONZO JAMES JR ID:...
-        orig = re.search(r"ORIG:\d*/([^/]+?)\s*ID:", description)
+        orig = _WIRE_ORIG_RE.search(description)
         if orig:
             return orig.group(1).strip()
         return None
@@ -180,24 +242,19 @@ class BofACSVParser:
         #   Zelle payment to NAME for MEMO"; Conf# xxx"
         #   Zelle payment from NAME Conf# xxx
         # We extract just the payee NAME.
-        zelle = re.match(
-            r'(?i)^Zelle\s+payment\s+(?:to|from)\s+'   # prefix
-            r'(.+?)'                                     # payee (non-greedy)
-            r'(?:\s+for\s+.*|\s+Conf#.*|[";]+.*)$',     # stop at "for", "Conf#", or quote artifacts
-            desc,
-        )
+        zelle = _ZELLE_RE.match(desc)
         if zelle:
             return zelle.group(1).strip().rstrip('";')
 
         # ACH: "ACH Debit SYSCO CORP ID:..." / "ACH Credit ..." / "ACH Hold ..."
-        desc = re.sub(r"(?i)^ACH\s+(?:Debit|Credit|Hold)\s+", "", desc)
+        desc = _ACH_PREFIX_RE.sub("", desc)
         # Debit card: "PURCHASE AUTHORIZED ON 01/15 COSTCO..." / "PURCHASE ON 01/15 ..."
-        desc = re.sub(r"(?i)^PURCHASE\s+(?:AUTHORIZED\s+)?ON\s+\d{2}/\d{2}\s+", "", desc)
+        desc = _PURCHASE_PREFIX_RE.sub("", desc)
         # Checkcard: "CHECKCARD 0115 MERCHANT..."
-        desc = re.sub(r"(?i)^CHECKCARD\s+\d{4}\s+", "", desc)
+        desc = _CHECKCARD_PREFIX_RE.sub("", desc)
         # Trailing reference numbers: " ID:...", " Conf#..."
-        desc = re.sub(r"\s+ID:\S*$", "", desc)
-        desc = re.sub(r'\s+Conf#.*$', "", desc)
+        desc = _TRAILING_ID_RE.sub("", desc)
+        desc = _TRAILING_CONF_RE.sub("", desc)
         return desc.strip()
 
     def _categorize(self, description: str) -> Tuple[str, str, str]:
@@ -207,7 +264,7 @@ class BofACSVParser:
         to resolve the payee, then runs the payee through keyword rules.
         """
         # ── Check register lookup ────────────────────────────────────────
-        check_match = re.match(r"(?i)^check\s+(\d+)$", description.strip())
+        check_match = _CHECK_DESC_RE.match(description.strip())
         if check_match and self.check_register:
             check_num = check_match.group(1)
             entry = self.check_register.get(check_num)
@@ -221,7 +278,7 @@ class BofACSVParser:
                 payee_upper = payee.upper()
                 for rule in self.category_rules:
                     keyword = rule["keyword"].strip().upper()
-                    if re.search(r"\b" + re.escape(keyword) + r"\b", payee_upper):
+                    if _keyword_pattern(keyword).search(payee_upper):
                         vendor = rule.get("vendor_normalized", payee)
                         return (rule["category"], "check_register", vendor)
                 # No rule matched — still use payee as vendor_normalized
@@ -242,11 +299,11 @@ class BofACSVParser:
                 return ("1. Revenue/Sales Revenue", "auto", "Toast Deposit")
             if "DES:EOM" in desc_upper:
                 return ("1. Revenue/Sales Revenue", "auto", "Toast EOM Adjustment")
-            if re.search(r"TOAST,?\s*INC\.?\s+DES:\d{8}", desc_upper):
+            if _TOAST_SETTLEMENT_RE.search(desc_upper):
                 return ("1. Revenue/Sales Revenue", "auto", "Toast Settlement")
             if "DES:REF" in desc_upper:
                 return ("5. Operating Expenses (OPEX)/POS & Technology Fees", "auto", "Toast Refund")
-            if re.search(r"TOAST,?\s*INC\s+DES:TOAST", desc_upper):
+            if _TOAST_PLATFORM_RE.search(desc_upper):
                 return ("5. Operating Expenses (OPEX)/POS & Technology Fees", "auto", "Toast Platform Fee")
 
         # ── Standard keyword matching ────────────────────────────────────
@@ -254,7 +311,7 @@ class BofACSVParser:
         norm_upper = normalized.upper()
         for rule in self.category_rules:
             keyword = rule["keyword"].strip().upper()
-            if re.search(r"\b" + re.escape(keyword) + r"\b", norm_upper):
+            if _keyword_pattern(keyword).search(norm_upper):
                 vendor = rule.get("vendor_normalized", description)
                 # For wire transfers, prefer the parsed beneficiary/originator
                 wire_vendor = self._extract_wire_vendor(description)
@@ -273,14 +330,28 @@ class BankCategoryManager:
     """CRUD for bank transaction category rules stored in BigQuery"""
 
     TABLE = "BankCategoryRules"
+    RULES_CACHE_TTL = 60  # seconds
+
+    # table_ref -> {"rules": [...], "ts": epoch}; shared across instances
+    # because routes build a fresh manager per request.
+    _rules_cache: Dict[str, Dict] = {}
+
+    # table_refs already confirmed or created in this process
+    _ensured_tables: Set[str] = set()
 
     def __init__(self, bq_client: bigquery.Client, dataset_id: str):
         self.bq_client = bq_client
         self.dataset_id = dataset_id
         self.table_ref = f"{PROJECT_ID}.{self.dataset_id}.{self.TABLE}"
 
+    def invalidate_rules_cache(self) -> None:
+        """Drop the cached rule list so the next list_rules() re-queries."""
+        self._rules_cache.pop(self.table_ref, None)
+
     def _ensure_table(self) -> None:
-        """Create the rules table if it doesn't exist."""
+        """Create the rules table if it doesn't exist (checked once per process)."""
+        if self.table_ref in self._ensured_tables:
+            return
         try:
             self.bq_client.get_table(self.table_ref)
         except NotFound:
@@ -294,13 +365,14 @@ class BankCategoryManager:
             table = bigquery.Table(self.table_ref, schema=schema)
             self.bq_client.create_table(table)
             logger.info(f"Created {self.TABLE} table")
+        self._ensured_tables.add(self.table_ref)
 
     def seed_defaults(self) -> int:
         """Seed default rules if table is empty. Returns number seeded."""
         self._ensure_table()
 
         count_query = f"SELECT COUNT(*) as cnt FROM `{self.table_ref}`"
-        result = list(self.bq_client.query(count_query).result())[0]
+        result = next(iter(self.bq_client.query(count_query).result(max_results=1)))
         if result.cnt > 0:
             return 0
 
@@ -323,7 +395,11 @@ class BankCategoryManager:
         return len(rows)
 
     def list_rules(self) -> List[Dict]:
-        """Return all rules."""
+        """Return all rules (cached for RULES_CACHE_TTL seconds)."""
+        entry = self._rules_cache.get(self.table_ref)
+        if entry and time.time() - entry["ts"] < self.RULES_CACHE_TTL:
+            return [dict(r) for r in entry["rules"]]
+
         self._ensure_table()
         self.seed_defaults()
         query = f"""
@@ -332,7 +408,7 @@ class BankCategoryManager:
         ORDER BY LENGTH(keyword) DESC, keyword
         """
         rows = list(self.bq_client.query(query).result())
-        return [
+        rules = [
             {
                 "keyword": r.keyword,
                 "category": r.category,
@@ -340,6 +416,8 @@ class BankCategoryManager:
             }
             for r in rows
         ]
+        self._rules_cache[self.table_ref] = {"rules": rules, "ts": time.time()}
+        return [dict(r) for r in rules]
 
     def upsert_rule(self, keyword: str, category: str, vendor_normalized: str = "") -> None:
         """Add or update a single rule."""
@@ -367,6 +445,7 @@ class BankCategoryManager:
             ]
         )
         self.bq_client.query(merge_sql, job_config=job_config).result()
+        self.invalidate_rules_cache()
 
     def delete_rule(self, keyword: str) -> None:
         """Delete a rule by keyword."""
@@ -380,6 +459,7 @@ class BankCategoryManager:
             ]
         )
         self.bq_client.query(delete_sql, job_config=job_config).result()
+        self.invalidate_rules_cache()
 
 
 class CheckRegisterSync:
@@ -393,6 +473,9 @@ class CheckRegisterSync:
     TABLE = "CheckRegister"
     SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 
+    # table_refs already confirmed or created in this process
+    _ensured_tables: Set[str] = set()
+
     # Fuzzy column name mapping: sheet header → internal name
     _COL_ALIASES = {
         "check_number": ["check number", "check_number", "check #", "check no", "check", "number", "chk", "chk #", "chk no"],
@@ -408,7 +491,9 @@ class CheckRegisterSync:
         self.table_ref = f"{PROJECT_ID}.{self.dataset_id}.{self.TABLE}"
 
     def _ensure_table(self) -> None:
-        """Create the CheckRegister table if it doesn't exist."""
+        """Create the CheckRegister table if it doesn't exist (checked once per process)."""
+        if self.table_ref in self._ensured_tables:
+            return
         try:
             self.bq_client.get_table(self.table_ref)
         except NotFound:
@@ -424,6 +509,7 @@ class CheckRegisterSync:
             table = bigquery.Table(self.table_ref, schema=schema)
             self.bq_client.create_table(table)
             logger.info(f"Created {self.TABLE} table")
+        self._ensured_tables.add(self.table_ref)
 
     def _resolve_columns(self, headers: List[str]) -> Dict[str, int]:
         """Map sheet column headers to internal names via fuzzy matching.
@@ -475,10 +561,10 @@ class CheckRegisterSync:
 
             check_num = cell("check_number")
             # Skip blank rows or non-numeric check numbers
-            if not check_num or not re.search(r"\d+", check_num):
+            if not check_num or not _DIGITS_RE.search(check_num):
                 continue
             # Normalize to digits only (e.g. "#1414" → "1414")
-            check_num = re.sub(r"[^\d]", "", check_num)
+            check_num = _NON_DIGIT_RE.sub("", check_num)
 
             payee = cell("payee")
             amount_str = cell("amount")
@@ -695,6 +781,10 @@ class SecretManager:
 class ToastSFTPClient:
     """SFTP client for Toast data files"""
 
+    # Outstanding read requests during prefetch — pipelines reads so large
+    # exports aren't bound by one network round trip per 32KB block.
+    PREFETCH_REQUESTS = 64
+
     def __init__(self, host: str, port: int, username: str, private_key: str):
         self.host = host
         self.port = port
@@ -702,6 +792,8 @@ class ToastSFTPClient:
         self.private_key = private_key
         self._client = None
         self._sftp = None
+        self._dates = None
+        self._listings: Dict[str, list] = {}
 
     def connect(self):
         """Establish SFTP connection"""
@@ -718,6 +810,8 @@ class ToastSFTPClient:
             look_for_keys=False
         )
         self._sftp = self._client.open_sftp()
+        self._dates = None
+        self._listings = {}
         logger.info(f"Connected to SFTP: {self.host}")
 
     def disconnect(self):
@@ -728,20 +822,50 @@ class ToastSFTPClient:
             self._client.close()
         logger.info("Disconnected from SFTP")
 
+    def available_dates(self) -> Set[str]:
+        """Date directories on the server, listed once per connection"""
+        if self._dates is None:
+            self._dates = set(self._sftp.listdir("185129"))
+        return self._dates
+
     def list_files(self, date_str: str) -> List[str]:
-        """List files for a given date (YYYYMMDD format)"""
+        """List files for a given date (YYYYMMDD format).
+
+        Once available_dates() has been loaded (multi-date runs), dates absent
+        from it are skipped without listing their directory.
+        """
+        if self._dates is not None and date_str not in self._dates:
+            logger.warning(f"No directory found for date: {date_str}")
+            return []
         try:
-            path = f"185129/{date_str}"
-            files = self._sftp.listdir(path)
-            return [f for f in files if f.endswith('.csv')]
+            attrs = self._sftp.listdir_attr(f"185129/{date_str}")
         except FileNotFoundError:
             logger.warning(f"No directory found for date: {date_str}")
             return []
+        csvs = [a for a in attrs if a.filename.endswith('.csv')]
+        # Kept so date_fingerprint() needs no second listing of the directory
+        self._listings[date_str] = csvs
+        return [a.filename for a in csvs]
+
+    def date_fingerprint(self, date_str: str) -> str:
+        """Hash of (name, size, mtime) for a date's CSVs — changes when Toast re-exports.
+
+        Reuses the listing from list_files() when the date was just listed.
+        """
+        attrs = self._listings.get(date_str)
+        if attrs is None:
+            attrs = [
+                a for a in self._sftp.listdir_attr(f"185129/{date_str}")
+                if a.filename.endswith('.csv')
+            ]
+        entries = sorted(f"{a.filename}|{a.st_size}|{a.st_mtime}" for a in attrs)
+        return hashlib.blake2b("\n".join(entries).encode(), digest_size=16).hexdigest()
 
     def download_file(self, date_str: str, filename: str) -> bytes:
         """Download file contents as bytes"""
         path = f"185129/{date_str}/{filename}"
         with self._sftp.file(path, 'r') as f:
+            f.prefetch(max_concurrent_requests=self.PREFETCH_REQUESTS)
             return f.read()
 
     def __enter__(self):
@@ -758,15 +882,25 @@ class SchemaValidator:
     def __init__(self, bq_client: bigquery.Client, dataset_id: str):
         self.bq_client = bq_client
         self.dataset_id = dataset_id
+        # Schemas fetched so far, keyed by table. A validator lives for one
+        # pipeline run, and appends never alter a table's schema, so each
+        # table only needs fetching once even across a long backfill.
+        self._schemas: Dict[str, Dict[str, str]] = {}
 
     def get_table_schema(self, table_loc: str) -> Dict[str, str]:
         """Get current BigQuery table schema"""
+        cached = self._schemas.get(table_loc)
+        if cached is not None:
+            return cached
         try:
             table_ref = f"{PROJECT_ID}.{self.dataset_id}.{table_loc}"
             table = self.bq_client.get_table(table_ref)
-            return {field.name: field.field_type for field in table.schema}
         except NotFound:
+            # Not cached: the table may be created later in this run
             return {}
+        schema = {field.name: field.field_type for field in table.schema}
+        self._schemas[table_loc] = schema
+        return schema
 
     def detect_schema_changes(
         self,
@@ -814,16 +948,7 @@ class DataTransformer:
         if pd.isna(date_str) or date_str == '':
             return None
 
-        formats = [
-            "%m/%d/%y %I:%M %p",
-            "%m/%d/%y %I:%M:%S %p",
-            "%m/%d/%Y %I:%M %p",
-            "%m/%d/%Y %I:%M:%S %p",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d"
-        ]
-
-        for fmt in formats:
+        for fmt in _TOAST_DATETIME_FORMATS:
             try:
                 dt = datetime.strptime(str(date_str).strip(), fmt)
                 # Return as ISO format string for BigQuery TIMESTAMP compatibility
@@ -835,6 +960,28 @@ class DataTransformer:
         logger.warning(f"Could not parse datetime: {date_str}")
         return str(date_str).strip() if date_str else None
 
+    @staticmethod
+    def parse_toast_datetimes(values: pd.Series) -> pd.Series:
+        """Column-wise parse_toast_datetime: one vectorized pass per format"""
+        raw = values.to_numpy(dtype=object)
+        out = np.full(len(raw), None, dtype=object)
+        pending = np.flatnonzero(pd.notna(raw) & (raw != ''))
+        text = pd.Series(raw[pending], dtype=object).astype(str).str.strip()
+
+        for fmt in _TOAST_DATETIME_FORMATS:
+            if not len(pending):
+                break
+            parsed = pd.to_datetime(text, format=fmt, errors='coerce')
+            ok = parsed.notna().to_numpy()
+            out[pending[ok]] = parsed[ok].dt.strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+            pending, text = pending[~ok], text[~ok]
+
+        # If no format matches, keep the original string (BigQuery may still parse it)
+        if len(pending):
+            logger.warning(f"Could not parse {len(pending)} datetime value(s), e.g. {text.iloc[0]!r}")
+            out[pending] = text.to_numpy()
+        return pd.Series(out, index=values.index, dtype=object)
+
     @staticmethod
     def parse_duration(duration_str: str) -> Optional[str]:
         """Parse duration string (HH:MM:SS) to TIME format"""
@@ -842,6 +989,23 @@ class DataTransformer:
             return None
         return str(duration_str).strip()
 
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def sanitize_column_name(col: str) -> str:
+        """Snake-case a Toast header into a valid BigQuery column name.
+
+        BigQuery column names: letters, numbers, underscores only; must start
+        with a letter or underscore. Toast reuses the same headers in every
+        export, so results are cached per header.
+        """
+        name = col.lower().translate(_COLUMN_NAME_TRANS)
+        # Remove any remaining invalid characters
+        name = _INVALID_COLUMN_CHARS_RE.sub('', name)
+        # Ensure it starts with letter or underscore
+        if name and name[0].isdigit():
+            name = '_' + name
+        return name
+
     @staticmethod
     def prepare_for_bigquery(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -852,8 +1016,10 @@ class DataTransformer:
         - string for everything else
 
         This avoids type inference issues with BigQuery autodetect.
+
+        Columns are converted in place on the frame passed in, which is also
+        returned; pass a copy if the original must stay untouched.
         """
-        df = df.copy()
 
         # Columns that are truly numeric (amounts, counts, percentages, IDs)
         numeric_columns = {
@@ -888,25 +1054,22 @@ class DataTransformer:
                     pass
                 continue
 
-            # Boolean columns: keep as bool
+            # Boolean columns: keep values as bool, held in an object column
             if str(df[col].dtype) in ('bool', 'boolean'):
+                df[col] = df[col].astype('object')
                 continue
 
             # Everything else: convert to string with explicit dtype
             # This includes datetime columns, text columns, IDs, etc.
-            df[col] = df[col].apply(
-                lambda x: str(x) if pd.notna(x) and str(x) != '' else None
-            )
+            # Object columns stringify in one vectorized pass; other dtypes
+            # (datetimes especially) go through str() to keep its formatting
+            values = df[col]
+            if values.dtype == object:
+                as_str = values.astype(str)
+            else:
+                as_str = values.map(str)
             # Force the column to be object type to ensure pyarrow treats it as string
-            df[col] = df[col].astype('object')
-
-        # Final pass: ensure all non-numeric columns are strings
-        for col in df.columns:
-            if col == 'processing_date':
-                continue
-            if col not in numeric_columns:
-                if df[col].dtype != 'object':
-                    df[col] = df[col].astype('object')
+            df[col] = as_str.astype('object').where(values.notna() & (as_str != ''), None)
 
         return df
 
@@ -923,26 +1086,8 @@ class DataTransformer:
         df = df.rename(columns=column_mapping)
 
         # Convert remaining column names to snake_case and sanitize for BigQuery
-        # BigQuery column names: letters, numbers, underscores only; must start with letter or underscore
-        import re
-        def sanitize_column_name(col: str) -> str:
-            name = col.lower()
-            name = name.replace(' ', '_')
-            name = name.replace('#', 'number')
-            name = name.replace('?', '')
-            name = name.replace('/', '_')
-            name = name.replace('(', '').replace(')', '')
-            name = name.replace('-', '_')
-            name = name.replace('.', '_')
-            # Remove any remaining invalid characters
-            name = re.sub(r'[^a-z0-9_]', '', name)
-            # Ensure it starts with letter or underscore
-            if name and name[0].isdigit():
-                name = '_' + name
-            return name
-
         df.columns = [
-            column_mapping.get(col, sanitize_column_name(col))
+            column_mapping.get(col, self.sanitize_column_name(col))
             for col in df.columns
         ]
 
@@ -952,11 +1097,15 @@ class DataTransformer:
             mapped_col = column_mapping.get(col, col.lower().replace(' ', '_'))
             if mapped_col in df.columns:
                 # Convert to ISO string format - BigQuery will store as STRING
-                df[mapped_col] = df[mapped_col].apply(self.parse_toast_datetime)
+                df[mapped_col] = self.parse_toast_datetimes(df[mapped_col])
 
         # Handle duration columns
         if 'duration_opened_to_paid' in df.columns:
-            df['duration_opened_to_paid'] = df['duration_opened_to_paid'].apply(self.parse_duration)
+            durations = df['duration_opened_to_paid']
+            present = durations.notna() & (durations != '')
+            df['duration_opened_to_paid'] = (
+                durations.astype(str).str.strip().astype('object').where(present, None)
+            )
 
         # Add computed columns
         df['processing_date'] = pd.to_datetime(processing_date).date()
@@ -969,16 +1118,9 @@ class DataTransformer:
         bool_columns = ['voided', 'deferred', 'tax_exempt']
         for col in bool_columns:
             if col in df.columns:
-                def to_bool_string(x):
-                    if pd.isna(x) or x == '':
-                        return None
-                    x_str = str(x).lower().strip()
-                    if x_str in ('true', 'yes', '1', 'y'):
-                        return 'true'
-                    elif x_str in ('false', 'no', '0', 'n'):
-                        return 'false'
-                    return None
-                df[col] = df[col].apply(to_bool_string)
+                # Missing values stringify to "nan"/"none" and so map to None too
+                flags = df[col].astype(str).str.lower().str.strip().map(_BOOL_STRINGS)
+                df[col] = flags.astype('object').where(flags.notna(), None)
 
         # Prepare datatypes for BigQuery (handle nullable integers and floats)
         df = self.prepare_for_bigquery(df)
@@ -989,6 +1131,14 @@ class DataTransformer:
 class BigQueryLoader:
     """Handles BigQuery load operations"""
 
+    # Appends larger than CHUNK_ROWS are split and loaded as parallel jobs into
+    # a staging table, so Parquet serialization of one chunk overlaps the upload
+    # of another. A single copy job then appends the staging table to the
+    # target, keeping the append all-or-nothing: if any chunk fails, nothing
+    # reaches the target and a rerun won't duplicate rows.
+    CHUNK_ROWS = 500_000
+    MAX_CONCURRENT_LOADS = 4
+
     def __init__(self, client: bigquery.Client, dataset_id: str):
         self.client = client
         self.dataset_id = dataset_id
@@ -1028,6 +1178,7 @@ class BigQueryLoader:
 
         job_config = bigquery.LoadJobConfig(
             schema=schema,
+            source_format=bigquery.SourceFormat.PARQUET,
             write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE
         )
 
@@ -1055,6 +1206,7 @@ class BigQueryLoader:
 
         # Load to temp table
         job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
             write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE
         )
 
@@ -1106,12 +1258,46 @@ class BigQueryLoader:
 
         table_ref = self.get_table_ref(table_loc)
 
+        # Parquet is the client default today; pin it so frames always go
+        # over as columnar Arrow buffers, never row-by-row CSV encoding
         job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
             write_disposition=bigquery.WriteDisposition.WRITE_APPEND
         )
 
-        job = self.client.load_table_from_dataframe(df, table_ref, job_config=job_config)
-        job.result()
+        if len(df) <= self.CHUNK_ROWS:
+            self.client.load_table_from_dataframe(df, table_ref, job_config=job_config).result()
+            return len(df)
+
+        schema = self.client.get_table(table_ref).schema
+        staging_ref = f"{table_ref}_staging_{uuid.uuid4().hex[:12]}"
+        staging = bigquery.Table(staging_ref, schema=schema)
+        # Expires on its own if the cleanup below never runs
+        staging.expires = datetime.now(timezone.utc) + timedelta(days=1)
+        self.client.create_table(staging)
+
+        chunk_config = bigquery.LoadJobConfig(
+            schema=schema,
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND
+        )
+
+        def load(frame: pd.DataFrame) -> None:
+            self.client.load_table_from_dataframe(frame, staging_ref, job_config=chunk_config).result()
+
+        chunks = [df.iloc[i:i + self.CHUNK_ROWS] for i in range(0, len(df), self.CHUNK_ROWS)]
+        workers = min(self.MAX_CONCURRENT_LOADS, len(chunks))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() re-raises the first failed chunk's error
+                list(pool.map(load, chunks))
+            copy_config = bigquery.CopyJobConfig(
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND
+            )
+            self.client.copy_table(staging_ref, table_ref, job_config=copy_config).result()
+        finally:
+            self.client.delete_table(staging_ref, not_found_ok=True)
+        logger.info(f"Appended {len(df)} rows to {table_loc} in {len(chunks)} chunks")
 
         return len(df)
 
@@ -278,9 +278,12 @@ class SevenRoomsSync:
     """Sync SR reservations into BigQuery incrementally."""
 
     def __init__(self, bq_client: Optional[bigquery.Client] = None,
-                 secret_manager: Optional[SecretManager] = None) -> None:
+                 secret_manager: Optional[SecretManager] = None,
+                 http: Optional[requests.Session] = None) -> None:
         self.bq = bq_client or bigquery.Client(project=PROJECT_ID)
         self.sm = secret_manager or SecretManager(PROJECT_ID)
+        # One session per sync so /auth and every page reuse the TLS connection
+        self.http = http or requests.Session()
         self._token_cache = TokenCache()
 
     # ── Credentials ──────────────────────────────────────────────────────
@@ -296,7 +299,7 @@ class SevenRoomsSync:
         if cached:
             return cached
         client_id, client_secret, _ = self._get_credentials()
-        resp = requests.post(
+        resp = self.http.post(
             f"{SR_API_BASE}/auth",
             data={"client_id": client_id, "client_secret": client_secret},
             headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -320,7 +323,7 @@ class SevenRoomsSync:
                  _retries_429: int = 0) -> Dict:
         MAX_429_RETRIES = 5
         token = self._get_token()
-        resp = requests.get(
+        resp = self.http.get(
             f"{SR_API_BASE}{path}",
             params=params,
             headers={"Authorization": token, "Accept": "application/json"},
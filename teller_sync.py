@@ -349,12 +349,22 @@ class TellerSync:
         try:
             tables = ["OrderDetails_raw", "BankTransactions_raw", "BankCategoryRules",
                        "CheckRegister", "PaymentDetails_raw"]
+            # One __TABLES__ lookup instead of a get_table() round trip per table
+            meta_sql = f"""
+            SELECT table_id, row_count, size_bytes
+            FROM `{PROJECT_ID}.{DATASET_ID}.__TABLES__`
+            WHERE table_id IN UNNEST(@tables)
+            """
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ArrayQueryParameter("tables", "STRING", tables),
+            ])
+            found = {r.table_id: r for r in self.bq.query(meta_sql, job_config=job_config).result()}
             table_stats = {}
             for t in tables:
-                try:
-                    tbl = self.bq.get_table(f"{PROJECT_ID}.{DATASET_ID}.{t}")
-                    table_stats[t] = {"rows": tbl.num_rows, "size_mb": round(tbl.num_bytes / 1048576, 1)}
-                except Exception:
+                r = found.get(t)
+                if r is not None:
+                    table_stats[t] = {"rows": r.row_count, "size_mb": round(r.size_bytes / 1048576, 1)}
+                else:
                     table_stats[t] = {"rows": 0, "status": "missing"}
             health["tables"] = table_stats
         except Exception as e:
@@ -420,7 +430,7 @@ class TellerSync:
                 (SELECT MAX(CAST(transaction_date AS STRING)) FROM `{PROJECT_ID}.{DATASET_ID}.BankTransactions_raw`) AS latest_bank
             FROM `{PROJECT_ID}.{DATASET_ID}.OrderDetails_raw`
             """
-            row = list(self.bq.query(sql).result())[0]
+            row = next(iter(self.bq.query(sql).result(max_results=1)))
             health["data_freshness"] = {
                 "latest_toast_date": row.latest_toast,
                 "latest_bank_date": row.latest_bank,
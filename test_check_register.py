@@ -1,26 +1,33 @@
 #!/usr/bin/env python3
 """
-Test script for check register integration.
+Live integration test for check register integration.
 
 Creates a mock BofA CSV with various check scenarios, uploads it,
-and verifies the categorization logic works correctly.
+and verifies the categorization logic works correctly — one pytest
+case per scenario.
 
 Usage:
     python test_check_register.py [--url URL]
+    CHECK_REGISTER_URL=https://... pytest test_check_register.py
 
-Defaults to the production Cloud Run URL.
+Skipped unless a URL is supplied: it writes 2099-dated rows to the live
+BankTransactions table (and deletes them afterwards), so it is kept out of
+the default tests/ run.
 """
 
 import argparse
 import io
-import json
+import logging
+import os
 import sys
-import tempfile
 
+import pytest
 import requests
 
 DEFAULT_URL = "https://toast-etl-pipeline-t3di7qky4q-uc.a.run.app"
 
+logger = logging.getLogger(__name__)
+
 # ── Test CSV ─────────────────────────────────────────────────────────────────
 # Scenario breakdown:
 #   1. Check 1504 — "Reginald Davis" in register, matches keyword rule "REGINALD DAVIS"
@@ -84,105 +91,64 @@ EXPECTED = [
 ]
 
 
-def run_tests(base_url: str) -> bool:
-    """Upload test CSV and verify categorization results."""
-    url = f"{base_url}/upload-bank-csv"
+pytestmark = [
+    pytest.mark.skipif(
+        not os.environ.get("CHECK_REGISTER_URL"),
+        reason="set CHECK_REGISTER_URL (or run with --url) to test a live service",
+    ),
+    # All scenarios share one upload — keep them on a single xdist worker
+    pytest.mark.xdist_group("check_register"),
+]
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    return os.environ["CHECK_REGISTER_URL"].rstrip("/")
 
-    print("=" * 60)
-    print("Check Register Integration Test")
-    print("=" * 60)
 
+@pytest.fixture(scope="module")
+def session():
+    """One keep-alive session so every call shares a TCP/TLS connection."""
+    with requests.Session() as s:
+        yield s
+
+
+@pytest.fixture(scope="module")
+def uploaded_txns(session, base_url):
+    """Sync the register, upload TEST_CSV, and return the rows by description.
+
+    Deletes the 2099 test rows on teardown.
+    """
     # ── Step 1: Sync check register ─────────────────────────────────
-    print("\n[1/3] Syncing check register from Google Sheet...")
-    sync_resp = requests.post(f"{base_url}/sync-check-register")
-    if sync_resp.status_code != 200:
-        print(f"  FAIL: sync returned {sync_resp.status_code}: {sync_resp.text}")
-        return False
-    sync_data = sync_resp.json()
-    print(f"  OK: {sync_data.get('rows_synced', '?')} rows synced")
+    logger.info("[1/3] Syncing check register from Google Sheet...")
+    sync_resp = session.post(f"{base_url}/sync-check-register")
+    assert sync_resp.status_code == 200, \
+        f"sync returned {sync_resp.status_code}: {sync_resp.text}"
+    logger.info("  OK: %s rows synced", sync_resp.json().get("rows_synced", "?"))
 
     # ── Step 2: Upload test CSV ──────────────────────────────────────
-    print("\n[2/3] Uploading test CSV with check scenarios...")
+    logger.info("[2/3] Uploading test CSV with check scenarios...")
     files = {"file": ("test_checks_2099.csv", io.BytesIO(TEST_CSV.encode()), "text/csv")}
-    resp = requests.post(url, files=files)
-
-    if resp.status_code != 200:
-        print(f"  FAIL: upload returned {resp.status_code}: {resp.text}")
-        return False
-
+    resp = session.post(f"{base_url}/upload-bank-csv", files=files)
+    assert resp.status_code == 200, f"upload returned {resp.status_code}: {resp.text}"
     upload_result = resp.json()
-    print(f"  OK: {upload_result.get('rows_loaded', '?')} rows loaded, "
-          f"batch={upload_result.get('batch_id', '?')}")
+    logger.info("  OK: %s rows loaded, batch=%s",
+                upload_result.get("rows_loaded", "?"), upload_result.get("batch_id", "?"))
 
-    # ── Step 3: Query back the test rows and verify ──────────────────
-    print("\n[3/3] Verifying categorization of uploaded rows...")
-    txn_resp = requests.get(
+    # ── Step 3: Query back the test rows ─────────────────────────────
+    logger.info("[3/3] Querying uploaded rows...")
+    txn_resp = session.get(
         f"{base_url}/api/bank-transactions",
         params={"date_from": "2099-01-01", "date_to": "2099-12-31", "limit": 50, "status": "all"},
     )
-    if txn_resp.status_code != 200:
-        print(f"  FAIL: transaction query returned {txn_resp.status_code}: {txn_resp.text}")
-        return False
-
+    assert txn_resp.status_code == 200, \
+        f"transaction query returned {txn_resp.status_code}: {txn_resp.text}"
     txns = txn_resp.json().get("transactions", [])
-    # Build lookup by description
-    txn_map = {t["description"]: t for t in txns}
-
-    passed = 0
-    failed = 0
-
-    for exp in EXPECTED:
-        desc = exp["description"]
-        txn = txn_map.get(desc)
-        label = exp["label"]
-
-        if not txn:
-            print(f"\n  FAIL [{label}]")
-            print(f"    Transaction '{desc}' not found in API response")
-            failed += 1
-            continue
-
-        errors = []
-        actual_source = txn.get("category_source", "")
-        actual_vendor = txn.get("vendor_normalized", "")
-        actual_cat = txn.get("category", "")
-
-        if actual_source != exp["expect_source"]:
-            errors.append(
-                f"category_source: expected '{exp['expect_source']}', got '{actual_source}'"
-            )
-        if exp["expect_vendor_contains"].upper() not in actual_vendor.upper():
-            errors.append(
-                f"vendor_normalized: expected to contain '{exp['expect_vendor_contains']}', "
-                f"got '{actual_vendor}'"
-            )
-        if exp["expect_category_contains"].upper() not in actual_cat.upper():
-            errors.append(
-                f"category: expected to contain '{exp['expect_category_contains']}', "
-                f"got '{actual_cat}'"
-            )
-
-        if errors:
-            print(f"\n  FAIL [{label}]")
-            for e in errors:
-                print(f"    {e}")
-            failed += 1
-        else:
-            print(f"  PASS [{label}]")
-            print(f"    category={actual_cat}, source={actual_source}, vendor={actual_vendor}")
-            passed += 1
-
-    # ── Summary ──────────────────────────────────────────────────────
-    print("\n" + "=" * 60)
-    total = passed + failed
-    if failed == 0:
-        print(f"ALL {total} TESTS PASSED")
-    else:
-        print(f"{passed}/{total} passed, {failed} FAILED")
-    print("=" * 60)
+
+    yield {t["description"]: t for t in txns}
 
     # ── Cleanup: delete the 2099 test rows ───────────────────────────
-    print("\nCleaning up test transactions (date=2099)...")
+    logger.info("Cleaning up test transactions (date=2099)...")
     deletes = [
         {"transaction_date": txn["transaction_date"],
          "description": txn["description"],
@@ -191,18 +157,34 @@ def run_tests(base_url: str) -> bool:
         if txn.get("transaction_date", "").startswith("2099")
     ]
     if deletes:
-        del_resp = requests.post(
+        del_resp = session.post(
             f"{base_url}/api/bank-transactions/delete",
             json={"deletes": deletes},
         )
         if del_resp.status_code == 200:
-            print(f"  Deleted {len(deletes)} test rows")
+            logger.info("  Deleted %d test rows", len(deletes))
         else:
-            print(f"  Warning: cleanup failed ({del_resp.status_code}): {del_resp.text}")
+            logger.warning("Cleanup failed (%s): %s", del_resp.status_code, del_resp.text)
     else:
-        print("  No test rows to clean up")
+        logger.info("  No test rows to clean up")
+
+
+@pytest.mark.parametrize("exp", EXPECTED, ids=[e["label"] for e in EXPECTED])
+def test_check_categorization(exp, uploaded_txns):
+    """Each scenario lands with the expected source, vendor and category."""
+    txn = uploaded_txns.get(exp["description"])
+    assert txn, f"Transaction '{exp['description']}' not found in API response"
+
+    actual_source = txn.get("category_source", "")
+    actual_vendor = txn.get("vendor_normalized", "")
+    actual_cat = txn.get("category", "")
 
-    return failed == 0
+    assert actual_source == exp["expect_source"], \
+        f"category_source: expected '{exp['expect_source']}', got '{actual_source}'"
+    assert exp["expect_vendor_contains"].upper() in actual_vendor.upper(), \
+        f"vendor_normalized: expected to contain '{exp['expect_vendor_contains']}', got '{actual_vendor}'"
+    assert exp["expect_category_contains"].upper() in actual_cat.upper(), \
+        f"category: expected to contain '{exp['expect_category_contains']}', got '{actual_cat}'"
 
 
 if __name__ == "__main__":
@@ -210,5 +192,13 @@ if __name__ == "__main__":
     parser.add_argument("--url", default=DEFAULT_URL, help="Base URL of the service")
     args = parser.parse_args()
 
-    success = run_tests(args.url)
-    sys.exit(0 if success else 1)
+    # Progress lines are INFO; TEST_LOG_LEVEL=INFO to see them. Run in-process
+    # (-n 0 overrides pytest.ini's xdist default) and print records live, since
+    # pytest otherwise captures them and logging config here wouldn't reach workers.
+    os.environ["CHECK_REGISTER_URL"] = args.url
+    sys.exit(pytest.main([
+        __file__, "-p", "no:cacheprovider", "-n", "0",
+        "-o", "log_cli=true",
+        f"--log-cli-level={os.environ.get('TEST_LOG_LEVEL', 'WARNING')}",
+        "--log-cli-format=%(levelname)s %(message)s",
+    ]))
@@ -4,14 +4,39 @@ import pytest
 from main import app as flask_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
     """Create Flask app configured for testing."""
     flask_app.config["TESTING"] = True
     return flask_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
-    """Flask test client — makes HTTP requests without a running server."""
+    """Flask test client — makes HTTP requests without a running server.
+
+    Shared for the session: no route sets cookies or uses the Flask session,
+    so there is no per-test client state to isolate.
+    """
     return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def _reset_bq_client_cache():
+    """Clear per-process BigQuery memos so each test's mocks apply.
+
+    Routes share one memoized client, the rules/check-register services
+    remember which tables they have already ensured, and bank category
+    rules are cached for up to RULES_CACHE_TTL seconds.
+    """
+    from services import BankCategoryManager, CheckRegisterSync, shared_bq_client
+
+    def clear():
+        shared_bq_client.cache_clear()
+        BankCategoryManager._rules_cache.clear()
+        BankCategoryManager._ensured_tables.clear()
+        CheckRegisterSync._ensured_tables.clear()
+
+    clear()
+    yield
+    clear()
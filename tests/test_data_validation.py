@@ -6,7 +6,53 @@ from unittest.mock import MagicMock, patch
 from types import SimpleNamespace
 
 from config import FILE_CONFIGS
-from services import DataTransformer, BigQueryLoader
+from services import DataTransformer, BigQueryLoader, BofACSVParser
+
+
+# ─── Shared fixtures ───────────────────────────────────────────────────────
+# These objects are stateless between calls, so one instance per module is
+# enough and saves rebuilding them (and their mocked clients) per test.
+
+@pytest.fixture(scope="module")
+def transformer():
+    return DataTransformer()
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    """ToastPipeline wired to mocked BigQuery / Secret Manager / alerting."""
+    from pipeline import ToastPipeline
+
+    with patch("pipeline.bigquery.Client"), \
+         patch("pipeline.SecretManager"), \
+         patch("pipeline.AlertManager"):
+        yield ToastPipeline()
+
+
+@pytest.fixture(scope="module")
+def bank_parser():
+    return BofACSVParser(category_rules=[], check_register=None)
+
+
+@pytest.fixture(scope="module")
+def order_df():
+    """A minimal OrderDetails DataFrame matching Toast CSV format.
+
+    transform_dataframe renames into a new frame, so sharing it is safe.
+    """
+    return pd.DataFrame({
+        "Location": ["LOV3"],
+        "Order Id": ["ORD-001"],
+        "Order #": [12345],
+        "Opened": ["01/15/25 06:00 PM"],
+        "Server": ["John"],
+        "Total": [125.50],
+        "Tip": [25.00],
+        "Gratuity": [20.00],
+        "# of Guests": [4],
+        "Revenue Center": ["Bar"],
+        "Service": ["Dine In"],
+    })
 
 
 # ─── FILE_CONFIGS schema validation ────────────────────────────────────────
@@ -57,53 +103,30 @@ class TestFileConfigSchemas:
 class TestTransformOutputQuality:
     """Validate that transformed DataFrames meet BigQuery load requirements."""
 
-    def _make_order_df(self):
-        """Create a minimal OrderDetails DataFrame matching Toast CSV format."""
-        return pd.DataFrame({
-            "Location": ["LOV3"],
-            "Order Id": ["ORD-001"],
-            "Order #": [12345],
-            "Opened": ["01/15/25 06:00 PM"],
-            "Server": ["John"],
-            "Total": [125.50],
-            "Tip": [25.00],
-            "Gratuity": [20.00],
-            "# of Guests": [4],
-            "Revenue Center": ["Bar"],
-            "Service": ["Dine In"],
-        })
-
-    def test_transform_adds_processing_date(self):
+    def test_transform_adds_processing_date(self, transformer, order_df):
         """Transformed DataFrame must include processing_date column."""
-        df = self._make_order_df()
-        transformer = DataTransformer()
         config = FILE_CONFIGS["OrderDetails.csv"]
-        result = transformer.transform_dataframe(df, config, "2025-01-15")
+        result = transformer.transform_dataframe(order_df, config, "2025-01-15")
         assert "processing_date" in result.columns
         assert str(result["processing_date"].iloc[0]) == "2025-01-15"
 
-    def test_transform_applies_column_mapping(self):
+    def test_transform_applies_column_mapping(self, transformer, order_df):
         """Column names should be mapped from Toast format to snake_case."""
-        df = self._make_order_df()
-        transformer = DataTransformer()
         config = FILE_CONFIGS["OrderDetails.csv"]
-        result = transformer.transform_dataframe(df, config, "2025-01-15")
+        result = transformer.transform_dataframe(order_df, config, "2025-01-15")
         # Original "Order Id" should become "order_id"
         assert "order_id" in result.columns
         assert "Order Id" not in result.columns
 
-    def test_transform_preserves_row_count(self):
+    def test_transform_preserves_row_count(self, transformer, order_df):
         """Transformation should not add or remove rows."""
-        df = self._make_order_df()
-        transformer = DataTransformer()
         config = FILE_CONFIGS["OrderDetails.csv"]
-        result = transformer.transform_dataframe(df, config, "2025-01-15")
-        assert len(result) == len(df)
+        result = transformer.transform_dataframe(order_df, config, "2025-01-15")
+        assert len(result) == len(order_df)
 
-    def test_transform_handles_empty_dataframe(self):
+    def test_transform_handles_empty_dataframe(self, transformer):
         """Empty DataFrame should transform without error."""
         df = pd.DataFrame()
-        transformer = DataTransformer()
         config = FILE_CONFIGS["OrderDetails.csv"]
         result = transformer.transform_dataframe(df, config, "2025-01-15")
         assert len(result) == 0
@@ -114,31 +137,15 @@ class TestTransformOutputQuality:
 class TestPipelineDataIntegrity:
     """Validate data flows correctly through the pipeline."""
 
-    @patch("pipeline.bigquery.Client")
-    def test_process_file_unknown_file_skipped(self, mock_bq_class):
+    def test_process_file_unknown_file_skipped(self, pipeline):
         """Files not in FILE_CONFIGS should be skipped, not errored."""
-        from pipeline import ToastPipeline
-
-        mock_bq_class.return_value = MagicMock()
-        with patch("pipeline.SecretManager"), \
-             patch("pipeline.AlertManager"):
-            pipeline = ToastPipeline()
-
         mock_sftp = MagicMock()
         result = pipeline.process_file(mock_sftp, "20260322", "UnknownFile.csv")
         assert result.status == "skipped"
         assert "No configuration" in result.error_message
 
-    @patch("pipeline.bigquery.Client")
-    def test_process_file_empty_csv_skipped(self, mock_bq_class):
+    def test_process_file_empty_csv_skipped(self, pipeline):
         """Empty CSV files should be skipped."""
-        from pipeline import ToastPipeline
-
-        mock_bq_class.return_value = MagicMock()
-        with patch("pipeline.SecretManager"), \
-             patch("pipeline.AlertManager"):
-            pipeline = ToastPipeline()
-
         mock_sftp = MagicMock()
         # Return a CSV with headers only (no data rows)
         mock_sftp.download_file.return_value = b"Location,Order Id,Order #\n"
@@ -153,54 +160,46 @@ class TestPipelineDataIntegrity:
 class TestBankCSVDataQuality:
     """Validate bank CSV parsing produces clean data."""
 
-    def test_parsed_amounts_are_numeric(self):
+    def test_parsed_amounts_are_numeric(self, bank_parser):
         """All amounts should be valid floats after parsing."""
-        from services import BofACSVParser
-        parser = BofACSVParser(category_rules=[], check_register=None)
         csv_content = (
             b"Date,Description,Amount,Running Bal.\n"
             b"01/15/2025,VENDOR A,-500.00,10000.00\n"
             b"01/16/2025,DEPOSIT,2000.00,12000.00\n"
             b"01/17/2025,VENDOR B,-123.45,11876.55\n"
         )
-        df = parser.parse(csv_content, "test.csv")
+        df = bank_parser.parse(csv_content, "test.csv")
         assert df["amount"].dtype in ["float64", "int64"]
         assert df["amount"].isna().sum() == 0
 
-    def test_parsed_dates_are_valid(self):
+    def test_parsed_dates_are_valid(self, bank_parser):
         """All transaction dates should be valid dates."""
-        from services import BofACSVParser
-        parser = BofACSVParser(category_rules=[], check_register=None)
         csv_content = (
             b"Date,Description,Amount,Running Bal.\n"
             b"01/15/2025,VENDOR,-500.00,10000.00\n"
         )
-        df = parser.parse(csv_content, "test.csv")
+        df = bank_parser.parse(csv_content, "test.csv")
         assert df["transaction_date"].iloc[0] is not None
         # Should be parseable as a date
         date_str = str(df["transaction_date"].iloc[0])
         assert len(date_str) >= 8  # at minimum YYYY-MM-DD
 
-    def test_every_row_has_category(self):
+    def test_every_row_has_category(self, bank_parser):
         """Every parsed row must have a category (even if Uncategorized)."""
-        from services import BofACSVParser
-        parser = BofACSVParser(category_rules=[], check_register=None)
         csv_content = (
             b"Date,Description,Amount,Running Bal.\n"
             b"01/15/2025,RANDOM VENDOR,-50.00,9950.00\n"
             b"01/16/2025,ANOTHER THING,-25.00,9925.00\n"
         )
-        df = parser.parse(csv_content, "test.csv")
+        df = bank_parser.parse(csv_content, "test.csv")
         assert df["category"].isna().sum() == 0
         assert df["category_source"].isna().sum() == 0
 
-    def test_source_file_tracked(self):
+    def test_source_file_tracked(self, bank_parser):
         """Every row should track which source file it came from."""
-        from services import BofACSVParser
-        parser = BofACSVParser(category_rules=[], check_register=None)
         csv_content = (
             b"Date,Description,Amount,Running Bal.\n"
             b"01/15/2025,VENDOR,-100.00,9900.00\n"
         )
-        df = parser.parse(csv_content, "stmt-19.csv")
+        df = bank_parser.parse(csv_content, "stmt-19.csv")
         assert df["source_file"].iloc[0] == "stmt-19.csv"
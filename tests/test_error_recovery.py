@@ -9,7 +9,7 @@ from google.cloud.exceptions import NotFound
 class TestBigQueryDown:
     """Routes should return proper errors when BigQuery is unreachable."""
 
-    @patch("routes_bank.bigquery.Client")
+    @patch("services.bigquery.Client")
     def test_bank_transactions_bq_error(self, mock_bq_class, client):
         """GET /api/bank-transactions returns 500 with error when BQ fails."""
         mock_client = MagicMock()
@@ -18,10 +18,10 @@ class TestBigQueryDown:
 
         resp = client.get("/api/bank-transactions")
         assert resp.status_code == 500
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert "error" in data
 
-    @patch("routes_etl.bigquery.Client")
+    @patch("services.bigquery.Client")
     def test_table_status_bq_error(self, mock_bq_class, client):
         """GET /status/<table> returns 404 when table not found."""
         mock_client = MagicMock()
@@ -30,7 +30,7 @@ class TestBigQueryDown:
 
         resp = client.get("/status/nonexistent")
         assert resp.status_code == 404
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert "error" in data
 
 
@@ -109,7 +109,7 @@ class TestBankUploadEdgeCases:
         )
         # Should return error, not 500
         assert resp.status_code in (400, 500)
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert "error" in data
 
     def test_csv_with_wrong_columns(self, client):
@@ -122,14 +122,14 @@ class TestBankUploadEdgeCases:
             content_type="multipart/form-data",
         )
         assert resp.status_code in (400, 500)
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert "error" in data
 
 
 class TestAnalyticsAPIMalformedInput:
     """Analytics APIs handle bad input without crashing."""
 
-    @patch("routes_analytics.bigquery.Client")
+    @patch("services.bigquery.Client")
     def test_profit_summary_missing_dates(self, mock_bq_class, client):
         """POST /profit-summary without dates returns 400."""
         resp = client.post(
@@ -139,7 +139,7 @@ class TestAnalyticsAPIMalformedInput:
         )
         assert resp.status_code == 400
 
-    @patch("routes_analytics.bigquery.Client")
+    @patch("services.bigquery.Client")
     def test_comprehensive_analysis_missing_dates(self, mock_bq_class, client):
         """POST /comprehensive-analysis without dates returns 400."""
         resp = client.post(
@@ -161,7 +161,7 @@ class TestDateInputValidation:
             content_type="application/json",
         )
         assert resp.status_code == 400
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert "Invalid" in data["error"]
 
     def test_profit_summary_start_after_end(self, client):
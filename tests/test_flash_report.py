@@ -1,6 +1,7 @@
 """Tests for Daily Flash Report feature."""
 
 import json
+import re
 from unittest.mock import patch, MagicMock
 from types import SimpleNamespace
 
@@ -71,12 +72,9 @@ class TestFlashReportAPI:
             content_type="application/json",
         )
         assert resp.status_code == 200
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert data["revenue"] == 12450
-        assert "top_servers" in data
-        assert "comparison" in data
-        assert "margins" in data
-        assert "cash" in data
+        assert {"top_servers", "comparison", "margins", "cash"} <= data.keys()
 
     def test_empty_body_defaults_to_yesterday(self, client):
         """Empty POST body should not return 400 (defaults to yesterday)."""
@@ -121,3 +119,62 @@ class TestFlashReportFormatting:
         assert "John" in msg
         assert "COGS" in msg
         assert "Cash" in msg
+
+
+class TestFlashReportQueries:
+    """Query helpers with a mocked BigQuery client."""
+
+    def test_query_cash_single_job(self):
+        from flash_report import FlashReport
+        fr = FlashReport.__new__(FlashReport)
+        fr.table_prefix = "`proj.ds"
+        fr.bq = MagicMock()
+        fr.bq.query.return_value.result.return_value = [
+            SimpleNamespace(cash_collected=3200.004, cash_deposited=2950.0)
+        ]
+
+        cash = fr._query_cash("2026-03-22")
+
+        assert fr.bq.query.call_count == 1
+        assert cash == {"collected": 3200.0, "deposited": 2950.0, "gap": 250.0}
+
+    def _report(self):
+        from flash_report import FlashReport
+        fr = FlashReport.__new__(FlashReport)
+        fr.table_prefix = "`proj.ds"
+        fr.bq = MagicMock()
+        return fr
+
+    def test_query_top_servers_decoded_from_arrow(self):
+        import pyarrow as pa
+        fr = self._report()
+        result = fr.bq.query.return_value.result.return_value
+        # Arrow types BigQuery uses for STRING / FLOAT64 / INT64 columns
+        result.to_arrow.return_value = pa.table({
+            "server": pa.array(["Jo", "Unknown"], pa.string()),
+            "revenue": pa.array([2340.5, 80.0], pa.float64()),
+            "orders": pa.array([12, 1], pa.int64()),
+            "tips": pa.array([400.25, 0.0], pa.float64()),
+        })
+
+        servers = fr._query_top_servers("2026-03-22")
+
+        result.to_arrow.assert_called_once_with(create_bqstorage_client=False)
+        sql = fr.bq.query.call_args.args[0]
+        for key in ("server", "revenue", "orders", "tips"):
+            assert re.search(rf"\bAS {key}\b", sql)
+        assert servers[0] == {"server": "Jo", "revenue": 2340.5, "orders": 12, "tips": 400.25}
+        assert [type(v) for v in servers[0].values()] == [str, float, int, float]
+
+    def test_query_revenue_reads_single_row(self):
+        fr = self._report()
+        fr.bq.query.return_value.result.return_value = iter([SimpleNamespace(
+            revenue=12450.456, orders=87, guests=234, avg_check=143.104, tips=2100, gratuity=1800,
+        )])
+
+        revenue = fr._query_revenue("2026-03-22")
+
+        fr.bq.query.return_value.result.assert_called_once_with(max_results=1)
+        assert revenue["revenue"] == 12450.46
+        assert type(revenue["orders"]) is int
+        assert revenue["avg_check"] == 143.1
@@ -0,0 +1,265 @@
+"""Unit tests for pipeline.py — ToastPipeline helpers."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from google.cloud.exceptions import NotFound
+
+from models import PipelineResult
+from pipeline import FINGERPRINT_TABLE, ToastPipeline
+
+
+@pytest.fixture
+def pipeline():
+    """ToastPipeline with its BigQuery, Secret Manager and alert clients mocked."""
+    with patch("pipeline.bigquery.Client"), \
+         patch("pipeline.SecretManager"), \
+         patch("pipeline.AlertManager"):
+        yield ToastPipeline()
+
+
+@pytest.fixture
+def sftp():
+    """The SFTP connection run() opens."""
+    with patch("pipeline.ToastSFTPClient") as mock_sftp_class:
+        conn = MagicMock()
+        mock_sftp_class.return_value.__enter__.return_value = conn
+        yield conn
+
+
+class TestGetDateRange:
+    """Backfill date list generation."""
+
+    def test_no_backfill_returns_processing_date(self):
+        assert ToastPipeline.get_date_range("20260322") == ["20260322"]
+
+    def test_backfill_newest_first(self):
+        assert ToastPipeline.get_date_range("20260302", 3) == [
+            "20260302", "20260301", "20260228", "20260227",
+        ]
+
+    def test_backfill_length(self):
+        dates = ToastPipeline.get_date_range("20260322", 400)
+        assert len(dates) == 401
+        assert dates[0] == "20260322"
+        assert dates[-1] == "20250215"
+
+    def test_invalid_date_raises(self):
+        with pytest.raises(ValueError):
+            ToastPipeline.get_date_range("2026-03-22", 2)
+
+
+class TestRunFileFanout:
+    """run() downloads serially and loads files on the worker pool."""
+
+    def test_results_kept_in_download_order(self, pipeline, sftp):
+        sftp.list_files.return_value = ["OrderDetails.csv", "Unknown.csv", "CheckDetails.csv"]
+        sftp.download_file.return_value = b"a\n1\n"
+
+        def fake_load(result, date_str, file_bytes):
+            result.status = "success"
+            result.rows_inserted = 10
+            return result
+
+        pipeline.load_file = fake_load
+        summary = pipeline.run("20260322", backfill_days=1)
+
+        names = [r.filename for r in summary.results]
+        assert names == ["OrderDetails.csv", "Unknown.csv", "CheckDetails.csv"] * 2
+        assert summary.files_processed == 4
+        assert summary.total_rows == 40
+        assert summary.status == "success"
+        # Unconfigured files are never downloaded
+        assert sftp.download_file.call_count == 4
+
+    def test_date_loads_finish_before_next_date_downloads(self, pipeline, sftp):
+        events = []
+        sftp.list_files.return_value = ["OrderDetails.csv", "CheckDetails.csv"]
+
+        def fake_download(date_str, filename):
+            events.append(("download", date_str))
+            return b"a\n1\n"
+
+        def fake_load(result, date_str, file_bytes):
+            events.append(("load", date_str))
+            result.status = "success"
+            return result
+
+        sftp.download_file.side_effect = fake_download
+        pipeline.load_file = fake_load
+        pipeline.run("20260322", backfill_days=1)
+
+        first_next_download = events.index(("download", "20260321"))
+        assert events[:first_next_download].count(("load", "20260322")) == 2
+
+    def test_dropped_columns_reported_in_summary(self, pipeline, sftp):
+        sftp.list_files.return_value = ["OrderDetails.csv"]
+        sftp.download_file.return_value = b"a\n1\n"
+
+        def fake_load(result, date_str, file_bytes):
+            result.status = "success"
+            result.dropped_columns = ["server", "tab_name"]
+            return result
+
+        pipeline.load_file = fake_load
+        summary = pipeline.run("20260322")
+
+        assert summary.files_processed == 1
+        assert summary.errors == ["OrderDetails.csv: dropped columns not in table: server, tab_name"]
+        sent = pipeline.alert_manager.send_summary_alert.call_args[0][0]
+        assert sent.errors == summary.errors
+
+    def test_single_date_run_skips_root_listing(self, pipeline, sftp):
+        sftp.list_files.return_value = []
+        pipeline.run("20260322")
+        sftp.available_dates.assert_not_called()
+
+    def test_backfill_root_listing_failure_tolerated(self, pipeline, sftp):
+        sftp.available_dates.side_effect = OSError("timeout")
+        sftp.list_files.return_value = []
+        summary = pipeline.run("20260322", backfill_days=2)
+        sftp.available_dates.assert_called_once()
+        assert sftp.list_files.call_count == 3
+        assert summary.status == "success"
+
+
+class TestRunFingerprintSkip:
+    """Dates whose SFTP listing is unchanged since the last clean load are skipped."""
+
+    def _run(self, pipeline, sftp, stored, force=False):
+        sftp.list_files.return_value = ["OrderDetails.csv"]
+        sftp.date_fingerprint.return_value = "abc123"
+        sftp.download_file.return_value = b"a\n1\n"
+        pipeline._load_fingerprints = MagicMock(return_value=stored)
+        pipeline._save_fingerprint = MagicMock()
+
+        def fake_load(result, date_str, file_bytes):
+            result.status = "success"
+            return result
+
+        pipeline.load_file = fake_load
+        return pipeline.run("20260322", force=force)
+
+    def test_unchanged_date_skipped(self, pipeline, sftp):
+        summary = self._run(pipeline, sftp, {"20260322": "abc123"})
+        assert summary.files_processed == 0
+        assert summary.results[0].status == "skipped"
+        sftp.download_file.assert_not_called()
+        pipeline._save_fingerprint.assert_not_called()
+
+    def test_changed_date_loaded_and_recorded(self, pipeline, sftp):
+        summary = self._run(pipeline, sftp, {"20260322": "old"})
+        assert summary.files_processed == 1
+        pipeline._save_fingerprint.assert_called_once_with("20260322", "abc123", summary.run_id)
+
+    def test_force_ignores_stored_fingerprint(self, pipeline, sftp):
+        summary = self._run(pipeline, sftp, {"20260322": "abc123"}, force=True)
+        assert summary.files_processed == 1
+        pipeline._load_fingerprints.assert_not_called()
+
+    def test_forced_run_creates_fingerprint_table(self, pipeline, sftp):
+        sftp.list_files.return_value = ["OrderDetails.csv", "CheckDetails.csv"]
+        sftp.date_fingerprint.return_value = "abc123"
+        sftp.download_file.return_value = b"a\n1\n"
+        pipeline.bq_client.get_table.side_effect = NotFound("missing")
+
+        def fake_load(result, date_str, file_bytes):
+            result.status = "success"
+            return result
+
+        pipeline.load_file = fake_load
+        pipeline.run("20260322", backfill_days=1, force=True)
+
+        pipeline.bq_client.get_table.assert_called_once_with(FINGERPRINT_TABLE)
+        pipeline.bq_client.create_table.assert_called_once()
+        # One fingerprint MERGE per date, each after the table exists
+        assert pipeline.bq_client.query.call_count == 2
+
+
+class TestLoadDataFrame:
+    """load_dataframe() takes a parsed frame straight through transform and load."""
+
+    @pytest.fixture(autouse=True)
+    def _mock_bigquery_side(self, pipeline):
+        pipeline.schema_validator = MagicMock()
+        pipeline.schema_validator.detect_schema_changes.return_value = (False, [])
+        pipeline.loader = MagicMock()
+
+    def _load(self, pipeline, df):
+        return pipeline.load_dataframe(
+            PipelineResult(filename="OrderDetails.csv", status="pending"), "20260322", df
+        )
+
+    def test_frame_transformed_and_appended(self, pipeline):
+        pipeline.schema_validator.get_table_schema.return_value = {"order_id": "STRING"}
+        pipeline.loader.append_data.return_value = 2
+
+        result = self._load(pipeline, pd.DataFrame({"Order Id": ["A", "B"], "Server": ["Jo", "Al"]}))
+
+        assert result.status == "success"
+        assert result.rows_processed == 2
+        assert result.rows_inserted == 2
+        pipeline.loader.delete_date_partition.assert_called_once_with("OrderDetails_raw", "2026-03-22")
+        loaded = pipeline.loader.append_data.call_args[0][0]
+        assert "order_id" in loaded.columns
+        # The schema lookup already showed the table exists
+        pipeline.loader.table_exists.assert_not_called()
+
+    def test_columns_outside_table_schema_not_loaded(self, pipeline):
+        pipeline.schema_validator.detect_schema_changes.return_value = (True, ["NEW COLUMN: server"])
+        pipeline.schema_validator.get_table_schema.return_value = {
+            "order_id": "STRING", "processing_date": "DATE",
+        }
+        pipeline.loader.append_data.return_value = 1
+
+        result = self._load(pipeline, pd.DataFrame({"Order Id": ["A"], "Server": ["Jo"]}))
+
+        assert result.status == "success"
+        assert result.dropped_columns == ["server"]
+        loaded = pipeline.loader.append_data.call_args[0][0]
+        assert list(loaded.columns) == ["order_id", "processing_date"]
+
+    def test_missing_table_created(self, pipeline):
+        pipeline.schema_validator.get_table_schema.return_value = {}
+        pipeline.loader.table_exists.return_value = False
+
+        result = self._load(pipeline, pd.DataFrame({"Order Id": ["A"]}))
+
+        assert result.status == "success"
+        pipeline.loader.create_table_from_df.assert_called_once()
+        pipeline.loader.delete_date_partition.assert_not_called()
+
+    def test_unparseable_bytes_reported_as_error(self, pipeline):
+        result = pipeline.load_file(
+            PipelineResult(filename="OrderDetails.csv", status="pending"), "20260322", b""
+        )
+        assert result.status == "error"
+
+
+class TestReadCsv:
+    """read_csv() uses the pyarrow reader unless it would change the data."""
+
+    def test_matches_default_parser(self, pipeline):
+        data = (
+            b'Order Id,Server,Opened,Total,Voided,Tip\n'
+            b'100000012345,"Smith, Al",01/15/25 06:00 PM,150.7,false,\n'
+            b'100000012346,Jo,01/15/25 06:10 PM,80,true,N/A\n'
+        )
+        pd.testing.assert_frame_equal(pipeline.read_csv(data), pd.read_csv(io.BytesIO(data)))
+
+    def test_iso_dates_keep_original_text(self, pipeline):
+        df = pipeline.read_csv(
+            b"Business Date,Fired,Elapsed\n2025-01-15,2025-01-15 18:20:00,01:05:00\n"
+        )
+        assert df.iloc[0].tolist() == ["2025-01-15", "2025-01-15 18:20:00", "01:05:00"]
+
+    def test_quoted_newline_falls_back(self, pipeline):
+        df = pipeline.read_csv(b'Server,Notes\nJo,"line one\nline two"\n')
+        assert df["Notes"].tolist() == ["line one\nline two"]
+
+    def test_duplicate_headers_deduped_like_default_parser(self, pipeline):
+        df = pipeline.read_csv(b"Tip,Tip,Server\n1,2,Jo\n")
+        assert df.columns.tolist() == ["Tip", "Tip.1", "Server"]
+        assert df.iloc[0].tolist() == [1, 2, "Jo"]
@@ -146,6 +146,20 @@ def test_transactions_sync_bubbles_up_plaid_errors():
             sync._fetch_transactions_sync("bad_token", cursor="")
 
 
+def test_non_json_error_body_is_truncated():
+    sync = PlaidSync(bq_client=MagicMock(), secret_manager=_mock_sm())
+    err_resp = _mock_resp(502, None)
+    err_resp.json.side_effect = ValueError("not json")
+    err_resp.content = b"<html>" + b"x" * 5000
+    err_resp.encoding = None
+    with patch("plaid_sync.requests.post", return_value=err_resp):
+        with pytest.raises(RuntimeError) as exc:
+            sync._fetch_transactions_sync("access_token", cursor="")
+    assert "<html>" in str(exc.value)
+    assert "x" * 394 in str(exc.value)
+    assert "x" * 395 not in str(exc.value)
+
+
 # ── Cursor state ────────────────────────────────────────────────────
 
 def test_load_cursor_empty_on_first_run():
@@ -170,6 +184,15 @@ def test_load_cursor_returns_saved_value():
     assert sync._load_cursor("item_x") == "saved_cursor_123"
 
 
+def test_state_table_checked_once_per_sync():
+    bq = MagicMock()
+    bq.query.return_value.result.side_effect = lambda: iter([])
+    sync = PlaidSync(bq_client=bq, secret_manager=_mock_sm())
+    sync._load_cursor("item_a")
+    sync._load_cursor("item_b")
+    assert bq.get_table.call_count == 1
+
+
 # ── Link token / exchange (auth handshake) ──────────────────────────
 
 def test_create_link_token_calls_correct_endpoint():
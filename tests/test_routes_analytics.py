@@ -0,0 +1,94 @@
+"""Unit tests for routes_analytics.py helpers and row-level export routes."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import routes_analytics
+from routes_analytics import _BQSTORAGE_MIN_ROWS, _result_rows
+
+
+def _mock_result(total_rows, rows):
+    result = MagicMock()
+    result.total_rows = total_rows
+    result.__iter__.return_value = iter(rows)
+    result.to_arrow.return_value.to_pylist.return_value = rows
+    return result
+
+
+class TestResultRows:
+    """Large results go through the Storage Read API, small ones page via REST."""
+
+    def test_small_result_iterates_rest_rows(self):
+        result = _mock_result(3, [{"a": 1}, {"a": 2}, {"a": 3}])
+        with patch.object(routes_analytics, "_bqstorage_client") as storage:
+            assert _result_rows(result) == [{"a": 1}, {"a": 2}, {"a": 3}]
+        storage.assert_not_called()
+        result.to_arrow.assert_not_called()
+
+    def test_large_result_uses_storage_client(self):
+        result = _mock_result(_BQSTORAGE_MIN_ROWS + 1, [{"a": 1}])
+        storage_client = MagicMock()
+        with patch.object(routes_analytics, "_bqstorage_client", return_value=storage_client):
+            assert _result_rows(result) == [{"a": 1}]
+        result.to_arrow.assert_called_once_with(bqstorage_client=storage_client)
+
+    def test_large_result_falls_back_without_storage_library(self):
+        result = _mock_result(_BQSTORAGE_MIN_ROWS + 1, [{"a": 1}])
+        with patch.object(routes_analytics, "_bqstorage_client", return_value=None):
+            assert _result_rows(result) == [{"a": 1}]
+        result.to_arrow.assert_not_called()
+
+
+class TestGuestExport:
+    """GET /api/guest-export — CSV built from dict-style rows."""
+
+    def test_csv_rows_from_arrow_dicts(self, client):
+        rows = [{
+            "customer_id": "c1", "name": "Jane Doe", "phone": "17135550123",
+            "email": "jane@example.com", "visits": 12, "total_spend": 640.0,
+            "avg_check": 53.33, "first_visit": date(2026, 1, 2),
+            "last_visit": date(2026, 3, 20), "recency_days": 11,
+            "linked_card": None, "linked_card_type": None,
+        }]
+        bq = MagicMock()
+        bq.query.return_value.result.return_value = _mock_result(len(rows), rows)
+        with patch.object(routes_analytics, "shared_bq_client", return_value=bq):
+            resp = client.get("/api/guest-export?start_date=2026-01-01&end_date=2026-03-31")
+        assert resp.status_code == 200
+        body = resp.get_data(as_text=True)
+        assert "Jane,Doe,jane@example.com,+17135550123,12,640.00,53.33,2026-01-02,2026-03-20,Champions" in body
+
+
+class TestReconcileChecks:
+    """POST /api/reconcile-checks — resolved checks written in one UPDATE."""
+
+    def test_single_batched_update(self, client):
+        from types import SimpleNamespace
+        rows = [
+            SimpleNamespace(transaction_date=date(2026, 3, 2), description="Check 1234", amount=-500.0),
+            SimpleNamespace(transaction_date=date(2026, 3, 3), description="Check 1235", amount=-75.0),
+            SimpleNamespace(transaction_date=date(2026, 3, 4), description="Check 9999", amount=-20.0),
+        ]
+        lookup = {
+            "1234": {"payee": "Sysco", "category": "COGS/Food", "vendor_normalized": "Sysco"},
+            "1235": {"payee": "Ecolab", "category": "OPEX/Supplies", "vendor_normalized": "Ecolab"},
+        }
+        bq = MagicMock()
+        bq.query.return_value.result.return_value = rows
+        with patch.object(routes_analytics, "shared_bq_client", return_value=bq), \
+             patch.object(routes_analytics, "CheckRegisterSync") as sync_cls, \
+             patch.object(routes_analytics, "BankCategoryManager") as cat_cls:
+            sync_cls.return_value.get_lookup.return_value = lookup
+            cat_cls.return_value.list_rules.return_value = []
+            resp = client.post("/api/reconcile-checks")
+
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert data["reconciled"] == 2
+        assert data["still_uncategorized"] == 1
+        # One SELECT plus one UPDATE, regardless of how many checks resolved
+        assert bq.query.call_count == 2
+        update_config = bq.query.call_args_list[1].kwargs["job_config"]
+        (param,) = update_config.query_parameters
+        assert param.name == "updates"
+        assert len(param.values) == 2
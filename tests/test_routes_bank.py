@@ -57,7 +57,7 @@ def _make_txn_row():
 class TestBankTransactionsAPI:
     """GET /api/bank-transactions with mocked BigQuery."""
 
-    @patch("routes_bank.bigquery.Client")
+    @patch("services.bigquery.Client")
     def test_returns_json_with_expected_shape(self, mock_bq_class, client):
         """API returns JSON with summary, transactions, categories keys."""
         mock_client = _mock_bq_client()
@@ -89,15 +89,13 @@ class TestBankTransactionsAPI:
         resp = client.get("/api/bank-transactions")
         assert resp.status_code == 200
 
-        data = json.loads(resp.data)
-        assert "summary" in data
-        assert "transactions" in data
-        assert "categories" in data
+        data = resp.get_json()
+        assert {"summary", "transactions", "categories"} <= data.keys()
         assert data["summary"]["total_count"] == 105
         assert len(data["transactions"]) == 1
         assert data["transactions"][0]["description"] == "SYSCO FOODS"
 
-    @patch("routes_bank.bigquery.Client")
+    @patch("services.bigquery.Client")
     def test_filters_by_status(self, mock_bq_class, client):
         """Status param filters uncategorized transactions."""
         mock_client = _mock_bq_client()
@@ -131,7 +129,7 @@ class TestBankUploadCSV:
         """Missing file in multipart form returns 400."""
         resp = client.post("/upload-bank-csv")
         assert resp.status_code == 400
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert "error" in data
 
     def test_empty_filename_returns_400(self, client):
@@ -14,7 +14,7 @@ class TestHealthEndpoint:
     def test_returns_healthy(self, client):
         resp = client.get("/")
         assert resp.status_code == 200
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert data["status"] == "healthy"
         assert data["service"] == "toast-etl-pipeline"
 
@@ -111,7 +111,7 @@ class TestRunEndpoint:
             content_type="application/json",
         )
         assert resp.status_code == 200
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert data["status"] == "success"
         assert data["files_processed"] == 7
 
@@ -139,11 +139,37 @@ class TestBackfillEndpoint:
         )
         assert resp.status_code == 400
 
+    def _backfill(self, client, body):
+        with patch("routes_etl.ToastPipeline") as mock_cls:
+            mock_cls.return_value.run.return_value = SimpleNamespace(
+                run_id="test", status="success", files_processed=0, total_rows=0, errors=[],
+            )
+            resp = client.post(
+                "/backfill",
+                headers=AUTH_HEADERS,
+                data=json.dumps(body),
+                content_type="application/json",
+            )
+        return resp, mock_cls.return_value.run
+
+    def test_reloads_every_date_by_default(self, client):
+        resp, run = self._backfill(client, {"start_date": "20260101", "end_date": "20260103"})
+        assert resp.status_code == 200
+        assert resp.get_json()["skip_unchanged"] is False
+        run.assert_called_once_with("20260103", backfill_days=2, force=True)
+
+    def test_skip_unchanged_opt_in(self, client):
+        resp, run = self._backfill(
+            client, {"start_date": "20260101", "end_date": "20260103", "skip_unchanged": True}
+        )
+        assert resp.get_json()["skip_unchanged"] is True
+        run.assert_called_once_with("20260103", backfill_days=2, force=False)
+
 
 class TestStatusEndpoint:
     """GET /status/<table> — table status (no auth required)."""
 
-    @patch("routes_etl.bigquery.Client")
+    @patch("services.bigquery.Client")
     def test_valid_table_returns_info(self, mock_bq_class, client):
         mock_client = MagicMock()
         mock_table = MagicMock()
@@ -153,18 +179,20 @@ class TestStatusEndpoint:
         mock_client.get_table.return_value = mock_table
 
         mock_query_result = MagicMock()
-        mock_query_result.result.return_value = [
-            SimpleNamespace(latest_date="2026-03-22", total_rows=5000)
-        ]
+        mock_query_result.result.return_value = [SimpleNamespace(latest_date="2026-03-22")]
         mock_client.query.return_value = mock_query_result
         mock_bq_class.return_value = mock_client
 
         resp = client.get("/status/order_details")
         assert resp.status_code == 200
-        data = json.loads(resp.data)
-        assert data["total_rows"] == 5000
-
-    @patch("routes_etl.bigquery.Client")
+        data = resp.get_json()
+        assert data["latest_processing_date"] == "2026-03-22"
+        # The query returns no row count; total_rows comes from table metadata
+        sql = mock_client.query.call_args.args[0]
+        assert "COUNT(" not in sql.upper()
+        assert data["total_rows"] == mock_table.num_rows
+
+    @patch("services.bigquery.Client")
     def test_unknown_table_returns_404(self, mock_bq_class, client):
         from google.cloud.exceptions import NotFound
         mock_client = MagicMock()
@@ -173,3 +201,12 @@ class TestStatusEndpoint:
 
         resp = client.get("/status/nonexistent_table")
         assert resp.status_code == 404
+
+    @patch("services.bigquery.Client")
+    def test_client_reused_across_requests(self, mock_bq_class, client):
+        from google.cloud.exceptions import NotFound
+        mock_bq_class.return_value.get_table.side_effect = NotFound("Table not found")
+
+        client.get("/status/a")
+        client.get("/status/b")
+        assert mock_bq_class.call_count == 1
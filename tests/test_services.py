@@ -1,7 +1,15 @@
 """Unit tests for business logic in services.py — BofACSVParser and DataTransformer."""
 
+from unittest.mock import MagicMock
+
+from google.cloud.exceptions import NotFound
+
 import pytest
-from services import BofACSVParser, DataTransformer
+from services import (
+    BigQueryLoader, BofACSVParser, BankCategoryManager, DataTransformer, SchemaValidator,
+    ToastSFTPClient,
+    _keyword_pattern,
+)
 
 
 # ─── BofACSVParser._categorize() tests ──────────────────────────────────────
@@ -78,6 +86,13 @@ class TestCategorizeKeywordMatching:
         assert cat == "Uncategorized"
         assert source == "uncategorized"
 
+    def test_keyword_requires_whole_word(self, parser):
+        cat, _, _ = parser._categorize("ADPX HOLDINGS")
+        assert cat == "Uncategorized"
+
+    def test_keyword_pattern_is_cached(self):
+        assert _keyword_pattern("SYSCO") is _keyword_pattern("SYSCO")
+
 
 class TestCategorizeCheckRegister:
     """Check register lookup — takes precedence over keyword matching."""
@@ -126,13 +141,9 @@ class TestCategorizeParseCSV:
 class TestDataTransformer:
     """DataTransformer static method tests."""
 
-    def test_parse_toast_datetime_valid(self):
-        result = DataTransformer.parse_toast_datetime("01/15/25 02:30 PM")
-        assert result == "2025-01-15 14:30:00"
-
-    def test_parse_toast_datetime_iso_format(self):
-        result = DataTransformer.parse_toast_datetime("2025-01-15 14:30:00")
-        assert result == "2025-01-15 14:30:00"
+    @pytest.mark.parametrize("raw", ["01/15/25 02:30 PM", "2025-01-15 14:30:00"])
+    def test_parse_toast_datetime_valid(self, raw):
+        assert DataTransformer.parse_toast_datetime(raw) == "2025-01-15 14:30:00"
 
     def test_parse_toast_datetime_empty(self):
         result = DataTransformer.parse_toast_datetime("")
@@ -142,6 +153,13 @@ class TestDataTransformer:
         result = DataTransformer.parse_toast_datetime("not-a-date")
         assert result == "not-a-date"  # returns original string
 
+    def test_parse_toast_datetimes_matches_scalar_parser(self):
+        import pandas as pd
+        values = ["01/15/25 02:30 PM", "1/5/2025 11:05:09 AM", "2025-01-15", "", None, "not-a-date"]
+        result = DataTransformer.parse_toast_datetimes(pd.Series(values, index=[5, 3, 9, 1, 0, 7]))
+        assert result.tolist() == [DataTransformer.parse_toast_datetime(v) for v in values]
+        assert result.index.tolist() == [5, 3, 9, 1, 0, 7]
+
     def test_parse_duration_valid(self):
         result = DataTransformer.parse_duration("0:45:00")
         assert result == "0:45:00"
@@ -149,3 +167,271 @@ class TestDataTransformer:
     def test_parse_duration_empty(self):
         result = DataTransformer.parse_duration("")
         assert result is None
+
+    @pytest.mark.parametrize("header, expected", [
+        ("# of Guests", "number_of_guests"),
+        ("Tax Exempt?", "tax_exempt"),
+        ("V/MC/D Fees", "v_mc_d_fees"),
+        ("Duration (Opened to Paid)", "duration_opened_to_paid"),
+        ("3rd-Party %", "_3rd_party_"),
+    ])
+    def test_sanitize_column_name(self, header, expected):
+        assert DataTransformer.sanitize_column_name(header) == expected
+
+    def test_sanitize_column_name_cached(self):
+        DataTransformer.sanitize_column_name.cache_clear()
+        DataTransformer.sanitize_column_name("Order Id")
+        DataTransformer.sanitize_column_name("Order Id")
+        info = DataTransformer.sanitize_column_name.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_bool_columns_become_true_false_strings(self):
+        import pandas as pd
+        df = pd.DataFrame({"Voided": [True, False, "Yes", " n ", "", None, "maybe"]})
+        result = DataTransformer().transform_dataframe(df, {}, "2025-01-15")
+        assert list(result["voided"]) == ["true", "false", "true", "false", None, None, None]
+
+
+# ─── BankCategoryManager rule cache tests ───────────────────────────────────
+
+class TestBankCategoryRuleCache:
+    """list_rules() is cached per table and busted by writes."""
+
+    @pytest.fixture
+    def manager(self):
+        bq = MagicMock()
+        row = MagicMock(keyword="SYSCO", category="COGS/Food", vendor_normalized="Sysco")
+        bq.query.return_value.result.return_value = [row]
+        mgr = BankCategoryManager(bq, "test_dataset")
+        mgr.seed_defaults = MagicMock(return_value=0)
+        mgr.invalidate_rules_cache()
+        yield mgr
+        mgr.invalidate_rules_cache()
+
+    def test_second_call_served_from_cache(self, manager):
+        first = manager.list_rules()
+        second = manager.list_rules()
+        assert first == second == [
+            {"keyword": "SYSCO", "category": "COGS/Food", "vendor_normalized": "Sysco"}
+        ]
+        assert manager.bq_client.query.call_count == 1
+
+    def test_upsert_invalidates_cache(self, manager):
+        manager.list_rules()
+        manager.upsert_rule("ADP", "Labor/Payroll", "ADP")
+        manager.list_rules()
+        # list, merge, list
+        assert manager.bq_client.query.call_count == 3
+
+    def test_cached_rules_not_mutated_by_caller(self, manager):
+        manager.list_rules()[0]["category"] = "changed"
+        assert manager.list_rules()[0]["category"] == "COGS/Food"
+
+
+class TestBankCategoryManagerEnsureTable:
+    """The rules table is checked or created once per process."""
+
+    def test_table_checked_once_per_process(self):
+        bq = MagicMock()
+        BankCategoryManager(bq, "ds")._ensure_table()
+        BankCategoryManager(bq, "ds")._ensure_table()
+        assert bq.get_table.call_count == 1
+
+    def test_created_table_not_checked_again(self):
+        bq = MagicMock()
+        bq.get_table.side_effect = NotFound("missing")
+        mgr = BankCategoryManager(bq, "ds")
+        mgr._ensure_table()
+        mgr._ensure_table()
+        assert bq.create_table.call_count == 1
+        assert bq.get_table.call_count == 1
+
+
+# ─── ToastSFTPClient tests ──────────────────────────────────────────────────
+
+class TestToastSFTPClientListing:
+    """Date directory listing is fetched once per connection."""
+
+    def _client(self, dates):
+        from types import SimpleNamespace
+        client = ToastSFTPClient("host", 22, "user", "key")
+        client._sftp = MagicMock()
+        client._sftp.listdir.return_value = dates
+        client._sftp.listdir_attr.return_value = [
+            SimpleNamespace(filename="OrderDetails.csv", st_size=100, st_mtime=1),
+            SimpleNamespace(filename="notes.txt", st_size=5, st_mtime=1),
+        ]
+        return client
+
+    def test_single_date_skips_root_listing(self):
+        client = self._client(["20260101"])
+        assert client.list_files("20260101") == ["OrderDetails.csv"]
+        client._sftp.listdir.assert_not_called()
+        client._sftp.listdir_attr.assert_called_once_with("185129/20260101")
+
+    def test_fingerprint_reuses_file_listing(self):
+        client = self._client(["20260101"])
+        client.list_files("20260101")
+        assert client.date_fingerprint("20260101")
+        assert client._sftp.listdir_attr.call_count == 1
+
+    def test_missing_date_skips_directory_listing(self):
+        client = self._client(["20260101"])
+        client.available_dates()
+        assert client.list_files("20251231") == []
+        client._sftp.listdir.assert_called_once_with("185129")
+
+    def test_root_listed_once_across_dates(self):
+        client = self._client(["20260101", "20260102"])
+        client.available_dates()
+        assert client.list_files("20260101") == ["OrderDetails.csv"]
+        assert client.list_files("20260102") == ["OrderDetails.csv"]
+        client._sftp.listdir.assert_called_once_with("185129")
+
+    def test_download_prefetches(self):
+        client = self._client(["20260101"])
+        handle = client._sftp.file.return_value.__enter__.return_value
+        handle.read.return_value = b"a,b\n1,2\n"
+        assert client.download_file("20260101", "OrderDetails.csv") == b"a,b\n1,2\n"
+        handle.prefetch.assert_called_once_with(
+            max_concurrent_requests=ToastSFTPClient.PREFETCH_REQUESTS
+        )
+
+    def test_date_fingerprint_tracks_size_and_mtime(self):
+        client = self._client(["20260101"])
+        attrs = client._sftp.listdir_attr.return_value
+        first = client.date_fingerprint("20260101")
+        attrs[1].st_size = 6  # non-CSV change is ignored
+        assert client.date_fingerprint("20260101") == first
+        attrs[0].st_mtime = 2
+        assert client.date_fingerprint("20260101") != first
+
+
+class TestPrepareForBigQuery:
+    """prepare_for_bigquery output dtypes."""
+
+    def test_column_dtypes(self):
+        import pandas as pd
+        df = pd.DataFrame({
+            "amount": ["1.5", "x"],
+            "server": ["Ann", ""],
+            "flag": [True, False],
+            "processing_date": [pd.Timestamp("2026-03-22").date()] * 2,
+        })
+        out = DataTransformer.prepare_for_bigquery(df)
+        assert out["amount"].dtype == "float64"
+        assert out["amount"].isna().tolist() == [False, True]
+        assert out["server"].iloc[0] == "Ann"
+        assert pd.isna(out["server"].iloc[1])
+        assert out["flag"].dtype == "object"
+        assert out["flag"].tolist() == [True, False]
+        assert out["processing_date"].tolist() == df["processing_date"].tolist()
+
+    def test_converts_in_place(self):
+        import pandas as pd
+        df = pd.DataFrame({"amount": ["1.5"], "server": ["Ann"]})
+        out = DataTransformer.prepare_for_bigquery(df)
+        assert out is df
+        assert df["amount"].dtype == "float64"
+
+
+# ─── SchemaValidator ─────────────────────────────────────────────────────────
+
+class TestSchemaValidatorCache:
+    """Table schemas are fetched once per validator."""
+
+    def _field(self, name, field_type):
+        field = MagicMock()
+        field.name = name
+        field.field_type = field_type
+        return field
+
+    def test_schema_fetched_once_per_table(self):
+        bq = MagicMock()
+        bq.get_table.return_value.schema = [self._field("order_id", "STRING")]
+        validator = SchemaValidator(bq, "ds")
+
+        assert validator.get_table_schema("OrderDetails_raw") == {"order_id": "STRING"}
+        assert validator.get_table_schema("OrderDetails_raw") == {"order_id": "STRING"}
+        assert bq.get_table.call_count == 1
+
+    def test_missing_table_is_not_cached(self):
+        bq = MagicMock()
+        bq.get_table.side_effect = [NotFound("gone"), MagicMock(schema=[])]
+        validator = SchemaValidator(bq, "ds")
+
+        assert validator.get_table_schema("OrderDetails_raw") == {}
+        validator.get_table_schema("OrderDetails_raw")
+        assert bq.get_table.call_count == 2
+
+
+# ─── BigQueryLoader ──────────────────────────────────────────────────────────
+
+class TestBigQueryLoader:
+    """DataFrame loads go to BigQuery as Parquet."""
+
+    def test_append_uses_parquet(self):
+        import pandas as pd
+        from google.cloud import bigquery
+
+        client = MagicMock()
+        loader = BigQueryLoader(client, "ds")
+        rows = loader.append_data(pd.DataFrame({"a": [1.0, 2.0]}), "OrderDetails_raw")
+
+        assert rows == 2
+        job_config = client.load_table_from_dataframe.call_args.kwargs["job_config"]
+        assert job_config.source_format == bigquery.SourceFormat.PARQUET
+        assert job_config.write_disposition == bigquery.WriteDisposition.WRITE_APPEND
+
+    def test_large_append_loaded_in_chunks(self):
+        import pandas as pd
+        from google.cloud import bigquery
+
+        client = MagicMock()
+        client.get_table.return_value.schema = [bigquery.SchemaField("a", "INT64")]
+        loader = BigQueryLoader(client, "ds")
+        loader.CHUNK_ROWS = 2
+        rows = loader.append_data(pd.DataFrame({"a": range(5)}), "OrderDetails_raw")
+
+        assert rows == 5
+        assert client.load_table_from_dataframe.call_count == 3
+        sizes = sorted(len(c.args[0]) for c in client.load_table_from_dataframe.call_args_list)
+        assert sizes == [1, 2, 2]
+        assert client.load_table_from_dataframe.return_value.result.call_count == 3
+
+        # Chunks land in one staging table, copied to the target in a single job
+        target = loader.get_table_ref("OrderDetails_raw")
+        staging = {c.args[1] for c in client.load_table_from_dataframe.call_args_list}
+        assert len(staging) == 1 and staging != {target}
+        client.copy_table.assert_called_once()
+        assert client.copy_table.call_args.args[:2] == (staging.pop(), target)
+        client.delete_table.assert_called_once()
+
+    def test_failed_chunk_leaves_target_untouched(self):
+        import pandas as pd
+        from google.cloud import bigquery
+
+        client = MagicMock()
+        client.get_table.return_value.schema = [bigquery.SchemaField("a", "INT64")]
+        client.load_table_from_dataframe.return_value.result.side_effect = [None, RuntimeError("quota")]
+        loader = BigQueryLoader(client, "ds")
+        loader.CHUNK_ROWS = 2
+        with pytest.raises(RuntimeError, match="quota"):
+            loader.append_data(pd.DataFrame({"a": range(4)}), "OrderDetails_raw")
+
+        target = loader.get_table_ref("OrderDetails_raw")
+        assert all(c.args[1] != target for c in client.load_table_from_dataframe.call_args_list)
+        client.copy_table.assert_not_called()
+        # The staging table is still cleaned up
+        client.delete_table.assert_called_once()
+
+    def test_create_table_uses_parquet(self):
+        import pandas as pd
+        from google.cloud import bigquery
+
+        client = MagicMock()
+        BigQueryLoader(client, "ds").create_table_from_df(
+            pd.DataFrame({"a": [1.0]}), "OrderDetails_raw"
+        )
+        job_config = client.load_table_from_dataframe.call_args.kwargs["job_config"]
+        assert job_config.source_format == bigquery.SourceFormat.PARQUET
@@ -147,7 +147,7 @@ def test_get_token_calls_auth_endpoint_with_form_body():
     resp.raise_for_status.return_value = None
     resp.json.return_value = {"status": 200, "msg": "ok",
                               "data": {"token": "tok_xyz", "token_expiration_datetime": future}}
-    with patch("sevenrooms_sync.requests.post", return_value=resp) as m:
+    with patch.object(srs.http, "post", return_value=resp) as m:
         token = srs._get_token()
     assert token == "tok_xyz"
     m.assert_called_once()
@@ -164,7 +164,7 @@ def test_get_token_uses_cache_on_second_call():
     resp.raise_for_status.return_value = None
     resp.json.return_value = {"status": 200, "msg": "ok",
                               "data": {"token": "tok_xyz", "token_expiration_datetime": future}}
-    with patch("sevenrooms_sync.requests.post", return_value=resp) as m:
+    with patch.object(srs.http, "post", return_value=resp) as m:
         srs._get_token()
         srs._get_token()
     assert m.call_count == 1
@@ -175,7 +175,7 @@ def test_get_token_raises_on_non_200_status_field():
     resp = MagicMock()
     resp.raise_for_status.return_value = None
     resp.json.return_value = {"status": 401, "msg": "bad creds", "data": None}
-    with patch("sevenrooms_sync.requests.post", return_value=resp):
+    with patch.object(srs.http, "post", return_value=resp):
         with pytest.raises(RuntimeError, match="SR /auth"):
             srs._get_token()
 
@@ -205,7 +205,7 @@ def test_fetch_reservations_paginates_until_cursor_none():
         r.json.return_value = p
         responses.append(r)
 
-    with patch("sevenrooms_sync.requests.get", side_effect=responses):
+    with patch.object(srs.http, "get", side_effect=responses):
         got = srs._fetch_reservations("2026-07-01T00:00:00Z", "vg_1")
     assert [r["id"] for r in got] == ["a", "b", "c"]
 
@@ -218,7 +218,7 @@ def test_fetch_reservations_stops_on_empty_results():
     r.status_code = 200
     r.raise_for_status.return_value = None
     r.json.return_value = _make_page([], "still_a_cursor_but_no_results")
-    with patch("sevenrooms_sync.requests.get", return_value=r):
+    with patch.object(srs.http, "get", return_value=r):
         got = srs._fetch_reservations("2026-07-01T00:00:00Z", "vg_1")
     assert got == []
 
@@ -240,8 +240,8 @@ def test_api_get_refreshes_token_on_401_and_retries_once():
                                     "data": {"token": "fresh_tok",
                                              "token_expiration_datetime": future}}
 
-    with patch("sevenrooms_sync.requests.get", side_effect=[r_401, r_ok]) as mget, \
-         patch("sevenrooms_sync.requests.post", return_value=auth_resp) as mpost:
+    with patch.object(srs.http, "get", side_effect=[r_401, r_ok]) as mget, \
+         patch.object(srs.http, "post", return_value=auth_resp) as mpost:
         srs._api_get("/reservations", {"venue_group_id": "vg_1"})
 
     assert mget.call_count == 2
@@ -250,6 +250,24 @@ def test_api_get_refreshes_token_on_401_and_retries_once():
     assert mget.call_args_list[1].kwargs["headers"]["Authorization"] == "fresh_tok"
 
 
+def test_api_calls_share_injected_session():
+    session = MagicMock()
+    srs = SevenRoomsSync(bq_client=MagicMock(), secret_manager=_mock_sm(), http=session)
+    future = (datetime.now(timezone.utc) + timedelta(hours=10)).isoformat()
+    session.post.return_value.json.return_value = {
+        "status": 200, "msg": "ok",
+        "data": {"token": "tok", "token_expiration_datetime": future},
+    }
+    session.get.return_value.status_code = 200
+    session.get.return_value.json.return_value = _make_page([], None)
+
+    srs._api_get("/reservations", {"venue_group_id": "vg_1"})
+    srs._api_get("/reservations", {"venue_group_id": "vg_1"})
+
+    assert session.post.call_count == 1
+    assert session.get.call_count == 2
+
+
 # ── Schema is stable ─────────────────────────────────────────────────────────
 
 def test_schema_has_id_required_and_synced_at_required():
@@ -1,6 +1,5 @@
 """Smoke tests — verify the app is alive and critical routes respond."""
 
-import json
 from unittest.mock import patch
 
 from q1_report import Q1ReportData, RevenueSection, CostSection, ProfitabilitySection
@@ -11,7 +10,7 @@ def test_health_returns_200(client):
     """GET / returns healthy status JSON."""
     resp = client.get("/")
     assert resp.status_code == 200
-    data = json.loads(resp.data)
+    data = resp.get_json()
     assert data["status"] == "healthy"
     assert data["service"] == "toast-etl-pipeline"
 
@@ -32,6 +31,13 @@ def test_pnl_returns_html(client):
     assert b"<html" in resp.data
 
 
+def test_dashboard_compressed_when_client_accepts_gzip(client):
+    """Large HTML responses are gzip-encoded when the client asks for it."""
+    resp = client.get("/pnl", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers.get("Content-Encoding") == "gzip"
+
+
 def test_404_on_unknown_route(client):
     """Unknown routes return 404."""
     resp = client.get("/nonexistent-route")
@@ -88,7 +94,7 @@ def test_comps_returns_html(client):
 
     empty = CompPeriod(label="w", start="2026-07-20", end="2026-07-26",
                        net_sales=0.0, total_comp=0.0)
-    with patch("routes_dashboards.bigquery.Client"), \
+    with patch("services.bigquery.Client"), \
          patch("comp_analytics.CompAnalytics") as CA:
         CA.return_value.compute_last_week.return_value = empty
         CA.return_value.compute_prior_week.return_value = empty
@@ -99,7 +105,7 @@ def test_comps_returns_html(client):
 
 
 def test_q1_report_html_returns_200_with_title(client):
-    with patch("routes_dashboards.bigquery.Client"), \
+    with patch("services.bigquery.Client"), \
          patch("routes_dashboards.Q1ReportGenerator") as Gen:
         Gen.return_value.fetch.return_value = _stub_q1_data()
         Gen.return_value.render_html.return_value = "<!DOCTYPE html><title>LOV3 / Houston — Q1 2026 Financial Review</title>"
@@ -109,7 +115,7 @@ def test_q1_report_html_returns_200_with_title(client):
 
 
 def test_q1_report_markdown_returns_200_with_header(client):
-    with patch("routes_dashboards.bigquery.Client"), \
+    with patch("services.bigquery.Client"), \
          patch("routes_dashboards.Q1ReportGenerator") as Gen:
         Gen.return_value.fetch.return_value = _stub_q1_data()
         Gen.return_value.render_markdown.return_value = "# LOV3|HTX — Q1 2026 Leadership Financial Report"
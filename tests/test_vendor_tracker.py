@@ -83,6 +83,44 @@ class TestVendorTrackerLogic:
         result = vt._detect_anomalies(trends)
         assert len(result) == 0
 
+    def test_anomaly_detection_uses_latest_two_months_per_vendor(self):
+        from vendor_tracker import VendorTracker
+        vt = VendorTracker.__new__(VendorTracker)
+        trends = [
+            {"vendor": "Sysco", "month": "2026-03", "spend": 1300, "txn_count": 5},  # +30%
+            {"vendor": "Sysco", "month": "2026-01", "spend": 100, "txn_count": 5},
+            {"vendor": "Sysco", "month": "2026-02", "spend": 1000, "txn_count": 5},
+            {"vendor": "ADP", "month": "2026-01", "spend": 500, "txn_count": 1},
+            {"vendor": "ADP", "month": "2026-02", "spend": 1500, "txn_count": 1},  # +200%
+            {"vendor": "Cintas", "month": "2026-01", "spend": 0, "txn_count": 1},
+            {"vendor": "Cintas", "month": "2026-02", "spend": 400, "txn_count": 1},  # no baseline
+            {"vendor": "Ecolab", "month": "2026-02", "spend": 900, "txn_count": 1},  # one month
+        ]
+        result = vt._detect_anomalies(trends)
+        assert [a["vendor"] for a in result] == ["ADP", "Sysco"]
+        assert result[0]["severity"] == "high"
+        assert result[1]["month"] == "2026-03"
+        assert result[1]["change_pct"] == 30.0
+        assert result[1]["severity"] == "medium"
+
+    def test_anomaly_detection_keeps_input_values_and_tie_order(self):
+        from decimal import Decimal
+        from vendor_tracker import VendorTracker
+        vt = VendorTracker.__new__(VendorTracker)
+        trends = [
+            {"vendor": "Zep", "month": "2026-01", "spend": 100, "txn_count": 1},
+            {"vendor": "Zep", "month": "2026-02", "spend": 200, "txn_count": 1},  # +100%
+            {"vendor": "Aramark", "month": "2026-01", "spend": Decimal("50.00"), "txn_count": 1},
+            {"vendor": "Aramark", "month": "2026-02", "spend": Decimal("100.00"), "txn_count": 1},  # +100%
+        ]
+        result = vt._detect_anomalies(trends)
+        # Equal changes stay in input order, not alphabetical
+        assert [a["vendor"] for a in result] == ["Zep", "Aramark"]
+        assert type(result[0]["prior_spend"]) is int and result[0]["prior_spend"] == 100
+        assert result[1]["prior_spend"] == Decimal("50.00")
+        assert type(result[1]["current_spend"]) is Decimal
+        assert type(result[0]["change_pct"]) is float
+
     def test_kpis_computation(self):
         from vendor_tracker import VendorTracker
         vt = VendorTracker.__new__(VendorTracker)
@@ -0,0 +1,79 @@
+"""Unit tests for weekly_report.py — query helpers with a mocked BigQuery client."""
+
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+
+from weekly_report import WeeklyReportGenerator
+
+
+def _generator():
+    gen = WeeklyReportGenerator.__new__(WeeklyReportGenerator)
+    gen.bq_client = MagicMock()
+    return gen
+
+
+def _assert_aliases(sql, keys):
+    for key in keys:
+        assert re.search(rf"\bas {key}\b", sql, re.IGNORECASE), key
+
+
+class TestArrowDecodedQueries:
+    """List queries decode Arrow rows into the same keys and types as before."""
+
+    def test_server_performance(self):
+        gen = _generator()
+        result = gen.bq_client.query.return_value.result.return_value
+        # Arrow types BigQuery uses for STRING / INT64 / FLOAT64 columns
+        result.to_arrow.return_value = pa.table({
+            "server": pa.array(["Jo"], pa.string()),
+            "orders": pa.array([42], pa.int64()),
+            "revenue": pa.array([5120.5], pa.float64()),
+            "tips": pa.array([800.0], pa.float64()),
+            "gratuity": pa.array([100.0], pa.float64()),
+            "server_grat": pa.array([70.0], pa.float64()),
+            "lov3_grat": pa.array([30.0], pa.float64()),
+        })
+
+        rows = gen.query_server_performance("2026-03-16", "2026-03-22")
+
+        result.to_arrow.assert_called_once_with(create_bqstorage_client=False)
+        keys = ["server", "orders", "revenue", "tips", "gratuity", "server_grat", "lov3_grat"]
+        _assert_aliases(gen.bq_client.query.call_args.args[0], keys)
+        assert list(rows[0]) == keys
+        assert [type(v) for v in rows[0].values()] == [str, int, float, float, float, float, float]
+
+    def test_payment_types(self):
+        gen = _generator()
+        result = gen.bq_client.query.return_value.result.return_value
+        result.to_arrow.return_value = pa.table({
+            "type": pa.array(["Credit"], pa.string()),
+            "transactions": pa.array([310], pa.int64()),
+            "amount": pa.array([18250.75], pa.float64()),
+        })
+
+        rows = gen.query_payment_types("2026-03-16", "2026-03-22")
+
+        _assert_aliases(gen.bq_client.query.call_args.args[0], ["type", "transactions", "amount"])
+        assert rows == [{"type": "Credit", "transactions": 310, "amount": 18250.75}]
+        assert [type(v) for v in rows[0].values()] == [str, int, float]
+
+
+class TestSingleRowQueries:
+    """Aggregate queries fetch just their one row."""
+
+    def test_revenue_summary(self):
+        gen = _generator()
+        gen.bq_client.query.return_value.result.return_value = iter([SimpleNamespace(
+            total_revenue=1000, total_tax=80, total_tips=150, total_gratuity=None,
+            grand_total=1230, avg_check_size=61.5, total_checks=20,
+        )])
+
+        summary = gen.query_revenue_summary("2026-03-16", "2026-03-22")
+
+        gen.bq_client.query.return_value.result.assert_called_once_with(max_results=1)
+        assert summary["total_revenue"] == 1000.0
+        assert summary["total_gratuity"] == 0.0
+        assert type(summary["total_checks"]) is int
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import pandas as pd
 from google.cloud import bigquery
 
 from config import PROJECT_ID, DATASET_ID
@@ -180,30 +182,47 @@ class VendorTracker:
 
     def _detect_anomalies(self, monthly_trends: List[Dict]) -> List[Dict]:
         """Flag vendors with >25% month-over-month spend increase."""
-        # Group by vendor → list of monthly spends
-        vendor_months: Dict[str, List[Dict]] = {}
-        for row in monthly_trends:
-            vendor_months.setdefault(row["vendor"], []).append(row)
+        if not monthly_trends:
+            return []
+
+        # Latest month per vendor, alongside the month before it. Vendors are
+        # numbered in first-seen order and rows remember their input position,
+        # so results keep the caller's spend values and tie order.
+        df = pd.DataFrame(monthly_trends, columns=["vendor", "month", "spend"])
+        df["row"] = np.arange(len(df))
+        df["vendor_order"] = df.groupby("vendor", sort=False, dropna=False).ngroup()
+        df = df.sort_values(["vendor_order", "month"], kind="stable")
+        grouped = df.groupby("vendor_order", sort=False)
+        df["prior_spend"] = grouped["spend"].shift(1)
+        df["prior_row"] = grouped["row"].shift(1)
+        latest = df.drop_duplicates("vendor_order", keep="last")
+
+        spend = latest["spend"].to_numpy(dtype=np.float64)
+        prior = latest["prior_spend"].to_numpy(dtype=np.float64)
+        # NaN prior (single month) compares False, so it drops out here too
+        has_base = prior > 0
+        # Work in one buffer: divide only where there is a baseline, in place
+        change_pct = np.subtract(spend, prior)
+        np.divide(change_pct, prior, out=change_pct, where=has_base)
+        change_pct *= 100
+        mask = has_base & (change_pct > 25)
+        if not mask.any():
+            return []
 
         anomalies = []
-        for vendor, months in vendor_months.items():
-            months.sort(key=lambda x: x["month"])
-            if len(months) < 2:
-                continue
-
-            latest = months[-1]
-            prior = months[-2]
-            if prior["spend"] > 0:
-                change_pct = (latest["spend"] - prior["spend"]) / prior["spend"] * 100
-                if change_pct > 25:
-                    anomalies.append({
-                        "vendor": vendor,
-                        "month": latest["month"],
-                        "current_spend": latest["spend"],
-                        "prior_spend": prior["spend"],
-                        "change_pct": round(change_pct, 1),
-                        "severity": "high" if change_pct > 50 else "medium",
-                    })
+        for row, prior_row, pct in zip(
+            latest["row"].to_numpy()[mask], latest["prior_row"].to_numpy()[mask], change_pct[mask]
+        ):
+            current = monthly_trends[row]
+            pct = float(pct)
+            anomalies.append({
+                "vendor": current["vendor"],
+                "month": current["month"],
+                "current_spend": current["spend"],
+                "prior_spend": monthly_trends[int(prior_row)]["spend"],
+                "change_pct": round(pct, 1),
+                "severity": "high" if pct > 50 else "medium",
+            })
 
         anomalies.sort(key=lambda x: x["change_pct"], reverse=True)
         return anomalies
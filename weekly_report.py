@@ -78,7 +78,7 @@ class WeeklyReportGenerator:
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
             AND (voided IS NULL OR voided = 'false')
         """
-        result = list(self.bq_client.query(query).result())[0]
+        result = next(iter(self.bq_client.query(query).result(max_results=1)))
         return {
             "total_revenue": float(result.total_revenue or 0),
             "total_tax": float(result.total_tax or 0),
@@ -100,7 +100,7 @@ class WeeklyReportGenerator:
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
             AND (voided IS NULL OR voided = 'false')
         """
-        totals = list(self.bq_client.query(totals_query).result())[0]
+        totals = next(iter(self.bq_client.query(totals_query).result(max_results=1)))
 
         # Orders by dining option - consolidate duplicates like "Bar, Bar" into "Bar"
         dining_query = f"""
@@ -189,31 +189,22 @@ class WeeklyReportGenerator:
         """Query revenue and order count by server with gratuity split"""
         query = f"""
         SELECT
-            COALESCE(server, 'Unknown') as server_name,
-            COUNT(DISTINCT order_id) as order_count,
-            COALESCE(SUM(total), 0) as total_revenue,
-            COALESCE(SUM(tip), 0) as total_tips,
-            COALESCE(SUM(gratuity), 0) as total_gratuity
+            COALESCE(server, 'Unknown') as server,
+            COUNT(DISTINCT order_id) as orders,
+            COALESCE(SUM(total), 0) as revenue,
+            COALESCE(SUM(tip), 0) as tips,
+            COALESCE(SUM(gratuity), 0) as gratuity,
+            COALESCE(SUM(gratuity), 0) * 0.70 as server_grat,
+            COALESCE(SUM(gratuity), 0) * 0.30 as lov3_grat
         FROM `{PROJECT_ID}.{DATASET_ID}.OrderDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
             AND (voided IS NULL OR voided = 'false')
         GROUP BY server
-        ORDER BY total_revenue DESC
+        ORDER BY revenue DESC
         LIMIT 15
         """
-        results = list(self.bq_client.query(query).result())
-        return [
-            {
-                "server": row.server_name,
-                "orders": int(row.order_count),
-                "revenue": float(row.total_revenue or 0),
-                "tips": float(row.total_tips or 0),
-                "gratuity": float(row.total_gratuity or 0),
-                "server_grat": float(row.total_gratuity or 0) * 0.70,
-                "lov3_grat": float(row.total_gratuity or 0) * 0.30
-            }
-            for row in results
-        ]
+        result = self.bq_client.query(query).result()
+        return result.to_arrow(create_bqstorage_client=False).to_pylist()
 
     def query_daily_breakdown(self, start_date: str, end_date: str) -> List[Dict]:
         """Query revenue and orders per day with prior week comparison"""
@@ -272,23 +263,16 @@ class WeeklyReportGenerator:
         """Query payment breakdown by type"""
         query = f"""
         SELECT
-            COALESCE(payment_type, 'Unknown') as payment_type,
-            COUNT(*) as transaction_count,
-            COALESCE(SUM(total), 0) as total_amount
+            COALESCE(payment_type, 'Unknown') as type,
+            COUNT(*) as transactions,
+            COALESCE(SUM(total), 0) as amount
         FROM `{PROJECT_ID}.{DATASET_ID}.PaymentDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         GROUP BY payment_type
-        ORDER BY total_amount DESC
+        ORDER BY amount DESC
         """
-        results = list(self.bq_client.query(query).result())
-        return [
-            {
-                "type": row.payment_type,
-                "transactions": int(row.transaction_count),
-                "amount": float(row.total_amount or 0)
-            }
-            for row in results
-        ]
+        result = self.bq_client.query(query).result()
+        return result.to_arrow(create_bqstorage_client=False).to_pylist()
 
     def query_week_over_week(self, start_date: str, end_date: str) -> Dict:
         """Compare current week vs prior week and same week last year"""
@@ -340,7 +324,7 @@ class WeeklyReportGenerator:
             COALESCE(ly.orders, 0) as ly_orders
         FROM current_week c, prior_week p, last_year ly
         """
-        result = list(self.bq_client.query(query).result())[0]
+        result = next(iter(self.bq_client.query(query).result(max_results=1)))
 
         current_revenue = float(result.current_revenue or 0)
         prior_revenue = float(result.prior_revenue or 0)
@@ -391,7 +375,7 @@ class WeeklyReportGenerator:
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
             AND (voided IS NULL OR voided = 'false')
         """
-        result = list(self.bq_client.query(query).result())[0]
+        result = next(iter(self.bq_client.query(query).result(max_results=1)))
 
         total = float(result.total_revenue or 1)
         liquor = float(result.liquor_revenue or 0)
@@ -415,7 +399,7 @@ class WeeklyReportGenerator:
         FROM `{PROJECT_ID}.{DATASET_ID}.CheckDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        result = list(self.bq_client.query(query).result())[0]
+        result = next(iter(self.bq_client.query(query).result(max_results=1)))
 
         total = int(result.total_checks or 0)
         high = int(result.high_checks or 0)
@@ -437,7 +421,7 @@ class WeeklyReportGenerator:
         FROM `{PROJECT_ID}.{DATASET_ID}.OrderDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        disc_result = list(self.bq_client.query(discount_query).result())[0]
+        disc_result = next(iter(self.bq_client.query(discount_query).result(max_results=1)))
 
         void_query = f"""
         SELECT
@@ -447,7 +431,7 @@ class WeeklyReportGenerator:
         FROM `{PROJECT_ID}.{DATASET_ID}.PaymentDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        void_result = list(self.bq_client.query(void_query).result())[0]
+        void_result = next(iter(self.bq_client.query(void_query).result(max_results=1)))
 
         total_discounts = float(disc_result.total_discounts or 0)
         gross = float(disc_result.gross_plus_disc or 1)
@@ -483,7 +467,7 @@ class WeeklyReportGenerator:
         FROM `{PROJECT_ID}.{DATASET_ID}.OrderDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        gross_result = list(self.bq_client.query(gross_query).result())[0]
+        gross_result = next(iter(self.bq_client.query(gross_query).result(max_results=1)))
         gross_sales = float(gross_result.gross_sales or 1)
 
         query = f"""
@@ -498,7 +482,7 @@ class WeeklyReportGenerator:
             AND reason_of_discount IS NOT NULL
             AND reason_of_discount != ''
         """
-        result = list(self.bq_client.query(query).result())[0]
+        result = next(iter(self.bq_client.query(query).result(max_results=1)))
 
         manager_comp = float(result.manager_comp or 0)
         open_discount = float(result.open_discount or 0)
@@ -598,7 +582,7 @@ class WeeklyReportGenerator:
         FROM `{PROJECT_ID}.{DATASET_ID}.PaymentDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        cash_result = list(self.bq_client.query(cash_query).result())[0]
+        cash_result = next(iter(self.bq_client.query(cash_query).result(max_results=1)))
 
         entries_query = f"""
         SELECT
@@ -608,7 +592,7 @@ class WeeklyReportGenerator:
         FROM `{PROJECT_ID}.{DATASET_ID}.CashEntries_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        entries_result = list(self.bq_client.query(entries_query).result())[0]
+        entries_result = next(iter(self.bq_client.query(entries_query).result(max_results=1)))
 
         cash_payments = int(cash_result.cash_payments or 0)
         total_payments = int(cash_result.total_payments or 1)
@@ -666,7 +650,7 @@ class WeeklyReportGenerator:
         FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        kitchen_result = list(self.bq_client.query(kitchen_query).result())[0]
+        kitchen_result = next(iter(self.bq_client.query(kitchen_query).result(max_results=1)))
 
         total_tickets = int(kitchen_result.total_tickets or 0)
         fulfilled = int(kitchen_result.fulfilled_tickets or 0)
@@ -701,35 +685,35 @@ class WeeklyReportGenerator:
         FROM `{PROJECT_ID}.{DATASET_ID}.OrderDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        rev = list(self.bq_client.query(rev_query).result())[0]
+        rev = next(iter(self.bq_client.query(rev_query).result(max_results=1)))
 
         disc_query = f"""
         SELECT ROUND(SUM(discount_amount) * 100.0 / NULLIF(SUM(amount + discount_amount), 0), 1) as discount_rate
         FROM `{PROJECT_ID}.{DATASET_ID}.OrderDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        disc = list(self.bq_client.query(disc_query).result())[0]
+        disc = next(iter(self.bq_client.query(disc_query).result(max_results=1)))
 
         void_query = f"""
         SELECT ROUND(COUNTIF(void_date IS NOT NULL AND void_date != '') * 100.0 / NULLIF(COUNT(*), 0), 2) as void_rate
         FROM `{PROJECT_ID}.{DATASET_ID}.PaymentDetails_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        void = list(self.bq_client.query(void_query).result())[0]
+        void = next(iter(self.bq_client.query(void_query).result(max_results=1)))
 
         cash_query = f"""
         SELECT COUNTIF(action = 'NO_SALE') as no_sale_count
         FROM `{PROJECT_ID}.{DATASET_ID}.CashEntries_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        cash = list(self.bq_client.query(cash_query).result())[0]
+        cash = next(iter(self.bq_client.query(cash_query).result(max_results=1)))
 
         kitchen_query = f"""
         SELECT ROUND(COUNTIF(fulfilled_date IS NOT NULL AND fulfilled_date != '') * 100.0 / NULLIF(COUNT(*), 0), 1) as fulfillment_rate
         FROM `{PROJECT_ID}.{DATASET_ID}.KitchenTimings_raw`
         WHERE processing_date BETWEEN '{start_date}' AND '{end_date}'
         """
-        kitchen = list(self.bq_client.query(kitchen_query).result())[0]
+        kitchen = next(iter(self.bq_client.query(kitchen_query).result(max_results=1)))
 
         weekly_revenue = float(rev.weekly_revenue or 0)
         discount_rate = float(disc.discount_rate or 0)